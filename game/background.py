@@ -1,8 +1,40 @@
 from __future__ import annotations
 import pygame
 import math
+from collections import deque
+import numpy as np
 from . import config
 from .noise import Noise1D
+from .cache import LRUCache
+
+
+def _row_alpha_surface(alpha_rows, width: int, rgb=(255, 255, 255)) -> pygame.Surface:
+    """Build a SRCALPHA surface of constant ``rgb`` whose alpha varies per row.
+
+    ``alpha_rows`` is a 1D array (one entry per row); it is broadcast across ``width``
+    straight into the pixel buffer, so no 1px column + ``transform.scale`` pass is needed.
+    """
+    h = len(alpha_rows)
+    surf = pygame.Surface((width, h), pygame.SRCALPHA)
+    surf.fill((*rgb, 0))
+    alpha = pygame.surfarray.pixels_alpha(surf)
+    alpha[:] = np.asarray(alpha_rows, dtype=np.uint8)[None, :]  # surfarray is (x, y)
+    del alpha  # release surface lock
+    return surf
+
+
+def _display_alpha(surf: pygame.Surface) -> pygame.Surface:
+    """Return ``surf`` in the display's per-pixel-alpha format (no-op before a display exists)."""
+    if pygame.display.get_surface() is not None:
+        return surf.convert_alpha()
+    return surf
+
+
+def _sample_columns(noise: Noise1D, start: int, stop: float, spacing: int, scale: float, octaves: int = 3):
+    """Return ``(xs, values)`` for spacing-aligned world columns ``start <= x <= stop``."""
+    xs = np.arange(start, math.floor(stop) + 1, spacing)
+    return xs, noise.fractal_array(xs * scale, octaves=octaves)
+
 
 class ParallaxBackground:
     def __init__(self, seed: int):
@@ -10,22 +42,22 @@ class ParallaxBackground:
         # Separate noise generator per layer for variety (offset seed) 
         for i, layer in enumerate(config.PARALLAX_LAYERS):
             noise = Noise1D(seed=seed + i * 101)
-            self.layers.append({"cfg": layer, "noise": noise})
+            # samples: sliding window of (world_x, noise) reused across frames
+            self.layers.append({"cfg": layer, "noise": noise, "samples": deque()})
         # Foreground silhouettes (close grass/foliage bands)
-        self.fg_layers = []  # each: {noise, offset_seed}
+        self.fg_layers = []  # each: {noise, rng (np.random.Generator)}
         if getattr(config, 'FOREGROUND_SILHOUETTES_ENABLED', False):
-            import random
             count = max(1, getattr(config, 'FOREGROUND_LAYER_COUNT', 1))
             for i in range(count):
                 n = Noise1D(seed=seed + 5000 + i * 137)
-                self.fg_layers.append({"noise": n, "rng": random.Random(seed + 7000 + i * 977)})
+                self.fg_layers.append({"noise": n, "rng": np.random.default_rng(seed + 7000 + i * 977)})
         # Foreground cache (per bucket camera position)
-        self._fg_cache = {}
+        self._fg_cache = LRUCache(getattr(config, 'FOREGROUND_CACHE_SIZE', 32))
         self._fg_last_key = None
         self._fg_surface = None
         self._last_camera_px = None
         # Cloud blobs (generated once)
-        self.clouds = []  # each entry: {speed, blobs:[(cx,cy,scale,surface)]}
+        self.clouds = []  # each entry: {speed, cxs, cys, scales (np arrays), surfaces (list)}
         if getattr(config, 'CLOUD_ENABLED', False):
             import random
             rng = random.Random(seed * 17 + 42)
@@ -33,7 +65,7 @@ class ParallaxBackground:
             density = getattr(config, 'CLOUD_DENSITY', 6)
             for layer_idx in range(count):
                 layer_speed = 0.05 + 0.1 * (layer_idx / max(1, count - 1))
-                blobs = []
+                cxs, cys, scales, surfaces = [], [], [], []
                 for _ in range(density):
                     cx = rng.uniform(-500, 1500)
                     cy = rng.uniform(40, 160 + layer_idx * 40)
@@ -43,57 +75,83 @@ class ParallaxBackground:
                     bh = int(60 * scale)
                     surf = pygame.Surface((bw, bh), pygame.SRCALPHA)
                     if getattr(config, 'CLOUD_SOFT_EDGES', True):
-                        # Radial falloff inside ellipse
+                        # Radial falloff inside ellipse, computed for all pixels at once
                         power = getattr(config, 'CLOUD_EDGE_FALLOFF_POWER', 2.0)
                         rw = bw / 2.0
                         rh = bh / 2.0
-                        cxp = rw
-                        cyp = rh
-                        for yy in range(bh):
-                            for xx in range(bw):
-                                nx = (xx - cxp) / rw
-                                ny = (yy - cyp) / rh
-                                d = nx * nx + ny * ny
-                                if d <= 1.0:
-                                    # inner intensity (1 at center -> 0 at edge)
-                                    inner = (1 - d) ** power
-                                    a = int(255 * inner)
-                                    surf.set_at((xx, yy), (255, 255, 255, a))
+                        nx = (np.arange(bw) - rw) / rw
+                        ny = (np.arange(bh) - rh) / rh
+                        d = ny[:, None] ** 2 + nx[None, :] ** 2
+                        # inner intensity (1 at center -> 0 at edge)
+                        inner = np.where(d <= 1.0, np.clip(1.0 - d, 0.0, None) ** power, 0.0)
+                        surf.fill((255, 255, 255, 0))
+                        alpha = pygame.surfarray.pixels_alpha(surf)
+                        alpha[:] = (255 * inner).astype(np.uint8).T  # surfarray is (x, y)
+                        del alpha  # release surface lock
                     else:
                         pygame.draw.ellipse(surf, (255, 255, 255, 255), surf.get_rect())
-                    blobs.append((cx, cy, scale, surf))
-                self.clouds.append({"speed": layer_speed, "blobs": blobs})
+                    surf = _display_alpha(surf)
+                    cxs.append(cx)
+                    cys.append(cy)
+                    scales.append(scale)
+                    surfaces.append(surf)
+                self.clouds.append({
+                    "speed": layer_speed,
+                    "cxs": np.array(cxs),
+                    "cys": np.array(cys),
+                    "scales": np.array(scales),
+                    "surfaces": surfaces,
+                })
+        # Tinted cloud blob cache keyed by (layer_idx, blob_idx, day bucket)
+        self._cloud_tint_cache = LRUCache(getattr(config, 'CLOUD_TINT_CACHE_SIZE', 128))
         # Parallax vertical fade mask (single column scaled) if enabled
         self._parallax_fade_mask = None
         if getattr(config, 'PARALLAX_VERTICAL_FADE_ENABLED', False):
             h = config.WINDOW_HEIGHT
-            col = pygame.Surface((1, h), pygame.SRCALPHA)
             power = getattr(config, 'PARALLAX_VERTICAL_FADE_POWER', 1.4)
-            for y in range(h):
-                t = y / (h - 1)
-                # Inverse fade: top opaque, lower portion fades allowing fog to dominate
-                a = int(255 * (1 - (t ** power)))
-                col.set_at((0, y), (255, 255, 255, a))
-            self._parallax_fade_mask = pygame.transform.scale(col, (config.WINDOW_WIDTH, h))
+            t = np.arange(h) / (h - 1)
+            # Inverse fade: top opaque, lower portion fades allowing fog to dominate
+            a = (255 * (1 - t ** power)).astype(np.uint8)
+            self._parallax_fade_mask = _row_alpha_surface(a, config.WINDOW_WIDTH)
         # Haze bands (soft horizontal atmospheric layers)
         self.haze_band_template = None
         self.haze_noise = None
         if getattr(config, 'HAZE_BANDS_ENABLED', False):
             band_h = max(10, int(config.WINDOW_HEIGHT * 0.12))
-            template = pygame.Surface((config.WINDOW_WIDTH, band_h), pygame.SRCALPHA)
             mid_alpha = getattr(config, 'HAZE_BAND_ALPHA', 18)
-            # Build vertical bell-curve alpha falloff (cosine)
-            for yy in range(band_h):
-                t = yy / (band_h - 1)
-                fade = math.sin(t * math.pi)  # 0 at edges -> 1 at center
-                a = int(mid_alpha * fade)
-                template.fill((255, 255, 255, a), pygame.Rect(0, yy, config.WINDOW_WIDTH, 1))
-            self.haze_band_template = template
+            # Build vertical bell-curve alpha falloff (sine: 0 at edges -> 1 at center)
+            t = np.arange(band_h) / (band_h - 1)
+            a = (mid_alpha * np.sin(t * np.pi)).astype(np.uint8)
+            self.haze_band_template = _row_alpha_surface(a, config.WINDOW_WIDTH)
             from math import floor  # silence potential linter about unused import if removed later
             self.haze_noise = Noise1D(seed=seed + 999)
+        self._haze_tint_cache = LRUCache(getattr(config, 'HAZE_TINT_CACHE_SIZE', 64))  # (day bucket, base color) -> tinted band
         # Fog cache
-        self._fog_cache = {}
+        self._fog_cache = LRUCache(getattr(config, 'FOG_CACHE_SIZE', 32))
         self._fog_last_bucket = None
+        # Config values read every frame, resolved once here instead of per-draw getattr lookups
+        self._fog_enabled = getattr(config, 'FOG_ENABLED', False)
+        self._fog_height_fraction = getattr(config, 'FOG_HEIGHT_FRACTION', 0.55)
+        self._fog_alpha_top = getattr(config, 'FOG_ALPHA_TOP', 0)
+        self._fog_alpha_bottom = getattr(config, 'FOG_ALPHA_BOTTOM', 140)
+        self._fog_color = getattr(config, 'FOG_COLOR', (170, 200, 215))
+        self._fog_twilight_enabled = getattr(config, 'FOG_TWILIGHT_ENABLED', False)
+        self._fog_twilight_span = getattr(config, 'FOG_TWILIGHT_SPAN', 0.18)
+        self._fog_twilight_warm = getattr(config, 'FOG_TWILIGHT_WARM', (225, 190, 150))
+        self._fog_twilight_steps = max(1, getattr(config, 'FOG_TWILIGHT_STEPS', 32))
+        self._fog_cache_steps = max(1, getattr(config, 'FOG_CACHE_STEPS', 160))
+        self._parallax_stride = max(1, getattr(config, 'PARALLAX_CACHE_STRIDE', 1))
+        self._haze_count = max(1, getattr(config, 'HAZE_BAND_COUNT', 3))
+        self._haze_noise_scale = getattr(config, 'HAZE_BAND_NOISE_SCALE', 0.002)
+        self._haze_tint_steps = max(2, getattr(config, 'HAZE_TINT_CACHE_STEPS', 48))
+        self._baseline = getattr(config, 'BASELINE', None)  # None -> 55% of surface height
+        self._cloud_alpha = getattr(config, 'CLOUD_ALPHA', 70)
+        self._cloud_color = getattr(config, 'CLOUD_COLOR', (255, 255, 255))
+        self._cloud_tint_day = getattr(config, 'CLOUD_TINT_DAY', (1, 1, 1))
+        self._cloud_tint_night = getattr(config, 'CLOUD_TINT_NIGHT', (0.8, 0.85, 1.05))
+        self._cloud_tint_steps = max(2, getattr(config, 'CLOUD_TINT_CACHE_STEPS', 64))
+        self._fg_skip_small_moves = getattr(config, 'FOREGROUND_MAX_FPS_IMPACT', True)
+        self._fg_stride = max(8, getattr(config, 'FOREGROUND_CACHE_STRIDE', 64))
 
     def _layer_points(self, layer, camera_x: float, width: int, height: int):
         cfg = layer["cfg"]
@@ -106,15 +164,25 @@ class ParallaxBackground:
         layer_cam = camera_x * speed_factor
         left_world = layer_cam - 100
         right_world = layer_cam + width + 200
-        points = []
-        x = int(left_world // spacing * spacing)
-        while x <= right_world:
-            n = noise.fractal(x * scale, octaves=3)
-            y = height * 0.4 - n * amp
-            # Convert layer world x to screen: subtract layer_cam, NOT full camera_x
-            screen_x = x - layer_cam
-            points.append((screen_x, y))
-            x += spacing
+        x0 = int(left_world // spacing * spacing)
+        # Slide the cached sample window; noise is only evaluated for newly exposed columns
+        samples = layer["samples"]
+        if samples and (samples[-1][0] < x0 or samples[0][0] > right_world):
+            samples.clear()  # no overlap (camera jump)
+        while samples and samples[0][0] < x0:
+            samples.popleft()
+        if samples and samples[0][0] > x0:
+            xs, ns = _sample_columns(noise, x0, samples[0][0] - spacing, spacing, scale)
+            samples.extendleft(zip(reversed(xs.tolist()), reversed(ns.tolist())))
+        while samples and samples[-1][0] > right_world:
+            samples.pop()
+        start = samples[-1][0] + spacing if samples else x0
+        if start <= right_world:
+            xs, ns = _sample_columns(noise, start, right_world, spacing, scale)
+            samples.extend(zip(xs.tolist(), ns.tolist()))
+        base_y = height * 0.4
+        # Convert layer world x to screen: subtract layer_cam, NOT full camera_x
+        points = [(sx - layer_cam, base_y - n * amp) for sx, n in samples]
         return points, speed_factor
 
     def get_sample_points(self, camera_x: float, width: int, height: int):
@@ -129,15 +197,33 @@ class ParallaxBackground:
     def draw(self, surface: pygame.Surface, camera_x: float, day_t: float = 1.0):
         w = surface.get_width()
         h = surface.get_height()
-        fog_enabled = getattr(config, 'FOG_ENABLED', False)
-        fog_start_y = int(h * getattr(config, 'FOG_HEIGHT_FRACTION', 0.55)) if fog_enabled else h
+        fog_enabled = self._fog_enabled
+        fog_start_y = int(h * self._fog_height_fraction) if fog_enabled else h
         # Draw parallax layers (closed to bottom; fog overlays later). Avoid per-layer full-surface allocations.
+        stride = self._parallax_stride
+        bucket = int(camera_x // stride)
+        cam_key = (bucket, w, h)
+        # Camera offset inside the bucket; cached outlines are laid out for the bucket origin
+        sub_x = camera_x - bucket * stride
         for layer in self.layers:
-            points, _ = self._layer_points(layer, camera_x, w, h)
-            if len(points) < 2:
+            # Hill outline only depends on the camera bucket; reuse it while the camera rests there
+            if layer.get("poly_key") != cam_key:
+                points, _ = self._layer_points(layer, bucket * stride, w, h)
+                poly = None
+                if len(points) >= 2:
+                    # points is a fresh list from _layer_points, so close it in place (no copy)
+                    points.extend(((points[-1][0], h), (points[0][0], h)))
+                    poly = points
+                layer["poly"] = poly
+                layer["poly_key"] = cam_key
+            poly = layer["poly"]
+            if poly is None:
                 continue
             base = layer["cfg"]["color"]
             depth = layer["cfg"].get("speed_factor", 0.5)
+            shift = sub_x * depth
+            if shift:
+                poly = [(x - shift, y) for x, y in poly]
             # Atmospheric fade: deeper layers (smaller speed_factor) blend more with sky
             fade = 1.0 - min(1.0, depth * 1.5)
             # Day-night tint: lerp between night-dim and full color
@@ -148,19 +234,25 @@ class ParallaxBackground:
             g = int(base[1] * brightness * (0.55 + 0.45 * fade))
             b = int(base[2] * brightness * (0.55 + 0.45 * fade))
             color = (min(255, r), min(255, g), min(255, b))
-            poly = points.copy()
-            poly.append((points[-1][0], h))
-            poly.append((points[0][0], h))
+            # draw.polygon benchmarks faster than gfxdraw.filled_polygon for these wide fills
             pygame.draw.polygon(surface, color, poly, 0)
         # Haze bands (draw after parallax, before clouds, so clouds sit above them)
         if self.haze_band_template is not None:
-            count = max(1, getattr(config, 'HAZE_BAND_COUNT', 3))
-            noise_scale = getattr(config, 'HAZE_BAND_NOISE_SCALE', 0.002)
-            base_col = getattr(config, 'FOG_COLOR', (170, 200, 215))
-            # Day-night modulation (fade out at deep night a bit)
-            dn = 0.55 + 0.45 * day_t
-            tint = (int(base_col[0] * dn), int(base_col[1] * dn), int(base_col[2] * dn))
-            baseline = getattr(config, 'BASELINE', h * 0.55)
+            count = self._haze_count
+            noise_scale = self._haze_noise_scale
+            base_col = self._fog_color
+            # Day-night modulation (fade out at deep night a bit); quantized so tinted bands are cached
+            steps = self._haze_tint_steps
+            bucket = int(day_t * (steps - 1))
+            band = self._haze_tint_cache.lookup((bucket, base_col))
+            if band is None:
+                dn = 0.55 + 0.45 * (bucket / (steps - 1))
+                tint = (int(base_col[0] * dn), int(base_col[1] * dn), int(base_col[2] * dn))
+                # Tinted copy (alpha already encoded in template)
+                band = self.haze_band_template.copy()
+                band.fill((*tint, 255), special_flags=pygame.BLEND_RGBA_MULT)
+                band = self._haze_tint_cache.store((bucket, base_col), _display_alpha(band))
+            baseline = self._baseline if self._baseline is not None else h * 0.55
             vertical_span = baseline * 0.55  # region above baseline for haze distribution
             for i in range(count):
                 f = (i + 1) / (count + 1)
@@ -169,57 +261,69 @@ class ParallaxBackground:
                 n = self.haze_noise.fractal((camera_x * 0.25 + i * 311) * noise_scale, octaves=2)
                 offset = n * 28
                 y = int(center_y + offset - self.haze_band_template.get_height() / 2)
-                # Create a tinted copy (alpha already encoded in template)
-                band = self.haze_band_template.copy()
-                band.fill((*tint, 255), special_flags=pygame.BLEND_RGBA_MULT)
                 # Clip within screen
                 surface.blit(band, (0, y))
         # Clouds drawn after parallax layer shapes (so they sit above distant hills) but before fog so fog mists them
         if self.clouds:
-            cloud_alpha = getattr(config, 'CLOUD_ALPHA', 70)
-            base_col = getattr(config, 'CLOUD_COLOR', (255, 255, 255))
+            cloud_alpha = self._cloud_alpha
+            base_col = self._cloud_color
             # Apply additional tint interpolation
-            dt_day = getattr(config, 'CLOUD_TINT_DAY', (1, 1, 1))
-            dt_night = getattr(config, 'CLOUD_TINT_NIGHT', (0.8, 0.85, 1.05))
+            dt_day = self._cloud_tint_day
+            dt_night = self._cloud_tint_night
+            # Quantize day_t so tinted blobs can be reused across frames
+            steps = self._cloud_tint_steps
+            day_bucket = int(day_t * (steps - 1))
+            qt = day_bucket / (steps - 1)
             tint = (
-                dt_night[0] + (dt_day[0] - dt_night[0]) * day_t,
-                dt_night[1] + (dt_day[1] - dt_night[1]) * day_t,
-                dt_night[2] + (dt_day[2] - dt_night[2]) * day_t,
+                dt_night[0] + (dt_day[0] - dt_night[0]) * qt,
+                dt_night[1] + (dt_day[1] - dt_night[1]) * qt,
+                dt_night[2] + (dt_day[2] - dt_night[2]) * qt,
             )
-            for layer in self.clouds:
-                speed = layer['speed']
-                for cx, cy, sc, blob_surface in layer['blobs']:
-                    world_x = cx + camera_x * speed
-                    sx = (world_x % (w + 800)) - 400
-                    # Create a tinted copy with target alpha (reuse size)
-                    surf = blob_surface.copy()
-                    # Multiply color (approximate by filling with blend) then apply alpha
-                    r = max(0, min(255, int(base_col[0] * tint[0])))
-                    g = max(0, min(255, int(base_col[1] * tint[1])))
-                    b = max(0, min(255, int(base_col[2] * tint[2])))
-                    # For BLEND_RGBA_MULT color alpha channel is also multiplied; keep 255 then blit alpha separately
-                    surf.fill((r, g, b, 255), special_flags=pygame.BLEND_RGBA_MULT)
-                    if cloud_alpha < 255:
-                        # Apply desired final alpha by modulating overall surface alpha
-                        surf.set_alpha(cloud_alpha)
+            for layer_idx, layer in enumerate(self.clouds):
+                # Screen x for every blob of the layer in one pass (np.mod wraps like Python %)
+                sxs = ((layer['cxs'] + camera_x * layer['speed']) % (w + 800)) - 400
+                for blob_idx, (sx, cy, blob_surface) in enumerate(zip(sxs.tolist(), layer['cys'].tolist(), layer['surfaces'])):
+                    # Cull fully offscreen blobs before touching the tint cache
+                    if sx + blob_surface.get_width() < 0 or sx > w:
+                        continue
+                    key = (layer_idx, blob_idx, day_bucket)
+                    surf = self._cloud_tint_cache.lookup(key)
+                    if surf is None:
+                        # Create a tinted copy with target alpha (reuse size)
+                        surf = blob_surface.copy()
+                        # Multiply color (approximate by filling with blend) then apply alpha
+                        r = max(0, min(255, int(base_col[0] * tint[0])))
+                        g = max(0, min(255, int(base_col[1] * tint[1])))
+                        b = max(0, min(255, int(base_col[2] * tint[2])))
+                        # For BLEND_RGBA_MULT color alpha channel is also multiplied; keep 255 then blit alpha separately
+                        surf.fill((r, g, b, 255), special_flags=pygame.BLEND_RGBA_MULT)
+                        if cloud_alpha < 255:
+                            # Apply desired final alpha by modulating overall surface alpha
+                            surf.set_alpha(cloud_alpha)
+                        self._cloud_tint_cache.store(key, surf)
                     surface.blit(surf, (sx, cy))
-        # Apply parallax vertical fade mask (multiplies lower part) BEFORE fog to preserve layering
-        if self._parallax_fade_mask is not None:
+        # Apply parallax vertical fade mask (multiplies lower part) BEFORE fog to preserve layering.
+        # The mask is white with graded alpha, so it only scales destination alpha: on an opaque
+        # target (the display) it changes nothing and the fog blit is the single overlay pass.
+        if self._parallax_fade_mask is not None and surface.get_flags() & pygame.SRCALPHA:
             surface.blit(self._parallax_fade_mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
         # Fog overlay last for proper depth fade over clouds & layers
         if fog_enabled:
-            fog_top_alpha = getattr(config, 'FOG_ALPHA_TOP', 0)
-            fog_bottom_alpha = getattr(config, 'FOG_ALPHA_BOTTOM', 140)
+            fog_top_alpha = self._fog_alpha_top
+            fog_bottom_alpha = self._fog_alpha_bottom
             start_y = fog_start_y
             day_fade = 0.65 + 0.35 * (1 - day_t)
-            base_fog = getattr(config, 'FOG_COLOR', (170, 200, 215))
+            base_fog = self._fog_color
             # Twilight warm blend
-            if getattr(config, 'FOG_TWILIGHT_ENABLED', False):
-                span = getattr(config, 'FOG_TWILIGHT_SPAN', 0.18)
-                warm = getattr(config, 'FOG_TWILIGHT_WARM', (225, 190, 150))
+            if self._fog_twilight_enabled:
+                span = self._fog_twilight_span
+                warm = self._fog_twilight_warm
                 edge_t = min(day_t, 1 - day_t)
                 if edge_t < span:
                     k = 1 - (edge_t / span)  # 1 at exact edge (sunrise/sunset), 0 outside span
+                    # Quantize so (bucket, base_fog) cache keys repeat instead of missing every twilight frame
+                    k_steps = self._fog_twilight_steps
+                    k = round(k * k_steps) / k_steps
                     base_fog = (
                         int(base_fog[0] * (1 - k) + warm[0] * k),
                         int(base_fog[1] * (1 - k) + warm[1] * k),
@@ -227,21 +331,21 @@ class ParallaxBackground:
                     )
             fog_height = h - start_y
             if fog_height > 0:
-                steps = max(1, getattr(config, 'FOG_CACHE_STEPS', 160))
+                steps = self._fog_cache_steps
                 bucket = int(day_t * (steps - 1))
                 cache_key = (bucket, base_fog)
-                grad_scaled = self._fog_cache.get(cache_key)
+                grad_scaled = self._fog_cache.lookup(cache_key)
                 if grad_scaled is None:
-                    grad = pygame.Surface((1, fog_height), pygame.SRCALPHA)
-                    for yy in range(fog_height):
-                        trow = yy / (fog_height - 1) if fog_height > 1 else 1.0
-                        a = int((fog_top_alpha * (1 - trow) + fog_bottom_alpha * trow) * day_fade)
-                        grad.set_at((0, yy), (*base_fog, a))
-                    grad_scaled = pygame.transform.scale(grad, (w, fog_height))
-                    self._fog_cache[cache_key] = grad_scaled
+                    if fog_height > 1:
+                        trow = np.arange(fog_height) / (fog_height - 1)
+                    else:
+                        trow = np.ones(1)
+                    a = ((fog_top_alpha * (1 - trow) + fog_bottom_alpha * trow) * day_fade).astype(np.uint8)
+                    grad_scaled = _display_alpha(_row_alpha_surface(a, w, base_fog))
+                    self._fog_cache.store(cache_key, grad_scaled)
                 surface.blit(grad_scaled, (0, start_y))
 
-    def draw_foreground(self, surface: pygame.Surface, camera_x: float, day_t: float):
+    def draw_foreground(self, surface: pygame.Surface, camera_x: float, day_t: float, y_offset: int = 0):
         """Draw foreground silhouette grass layers for extra depth.
 
         Draw AFTER terrain but BEFORE player so player appears in front of silhouettes.
@@ -249,22 +353,21 @@ class ParallaxBackground:
         if not self.fg_layers:
             return
         # Skip recompute for tiny camera movement to reduce cost
-        if getattr(config, 'FOREGROUND_MAX_FPS_IMPACT', True):
+        if self._fg_skip_small_moves:
             if self._last_camera_px is not None and abs(camera_x - self._last_camera_px) < 0.8 and self._fg_surface is not None:
-                surface.blit(self._fg_surface, (0,0))
+                surface.blit(self._fg_surface, (0, y_offset))
                 return
             self._last_camera_px = camera_x
-        stride = max(8, getattr(config, 'FOREGROUND_CACHE_STRIDE', 64))
-        bucket = int(camera_x // stride)
+        bucket = int(camera_x // self._fg_stride)
         key = (bucket, int(day_t * 50))  # quantize day_t
-        cached = self._fg_cache.get(key)
-        if cached is not None:
-            self._fg_surface = cached
-            surface.blit(cached, (0,0))
-            return
-        # Rebuild
-        fg_surf = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-        baseline = getattr(config, 'BASELINE', surface.get_height() * 0.55)
+        fg_surf = self._fg_cache.get_or_build(key, lambda: self._render_foreground(surface.get_size(), camera_x, day_t))
+        self._fg_surface = fg_surf
+        surface.blit(fg_surf, (0, y_offset))
+
+    def _render_foreground(self, size, camera_x: float, day_t: float) -> pygame.Surface:
+        """Bake all silhouette layers for the given camera position into a new SRCALPHA surface."""
+        fg_surf = pygame.Surface(size, pygame.SRCALPHA)
+        baseline = getattr(config, 'BASELINE', size[1] * 0.55)
         height_max = getattr(config, 'FOREGROUND_HEIGHT', 100)
         spacing = getattr(config, 'FOREGROUND_POINT_SPACING', 20)
         amplitude = getattr(config, 'FOREGROUND_AMPLITUDE', 30)
@@ -276,7 +379,7 @@ class ParallaxBackground:
         blade_chance = getattr(config, 'FOREGROUND_GRASS_BLADE_CHANCE', 0.2)
         blade_boost = getattr(config, 'FOREGROUND_GRASS_COLOR_BOOST', 1.25)
         noise_scale = getattr(config, 'FOREGROUND_NOISE_SCALE', 0.5)
-        w = surface.get_width()
+        w = size[0]
         # Day-night color modulation (slightly brighter at day, cooler/darker at night)
         night_dim = 0.55
         brightness = night_dim + (1 - night_dim) * day_t
@@ -295,44 +398,50 @@ class ParallaxBackground:
             left_world = local_cam - 50
             right_world = local_cam + w + 50
             x = int(left_world // spacing * spacing)
-            pts = []
-            while x <= right_world:
-                n = noise.fractal(x * noise_scale, octaves=3)
-                y = baseline - n * amplitude - (height_max * 0.15)
-                # vertical jitter for natural edge
-                y -= rng.uniform(-height_max * grass_jitter, height_max * grass_jitter)
-                sx = x - local_cam
-                pts.append((sx, y))
-                # Occasional blade tuft (small spike) by inserting an extra point
-                if blade_chance > 0 and rng.random() < blade_chance:
-                    # Clamp spike to softer range relative to lowered height_max
-                    spike_h = rng.uniform(height_max * 0.08, height_max * 0.25)
-                    pts.append((sx + spacing * 0.35, y - spike_h))
-                x += spacing
-            if len(pts) < 2:
+            xs, ns = _sample_columns(noise, x, right_world, spacing, noise_scale)
+            n_cols = xs.size
+            # vertical jitter for natural edge (all columns sampled in one call)
+            jitter = rng.uniform(-height_max * grass_jitter, height_max * grass_jitter, n_cols)
+            ys = baseline - ns * amplitude - (height_max * 0.15) - jitter
+            # Occasional blade tuft (small spike) inserted right after its column point
+            if blade_chance > 0:
+                blade = rng.random(n_cols) < blade_chance
+            else:
+                blade = np.zeros(n_cols, dtype=bool)
+            # Clamp spike to softer range relative to lowered height_max
+            spike_h = rng.uniform(height_max * 0.08, height_max * 0.25, n_cols)
+            base_idx = np.arange(n_cols) + np.concatenate(([0], np.cumsum(blade)[:-1])).astype(np.int64)
+            arr = np.empty((n_cols + int(blade.sum()), 2))
+            arr[base_idx, 0] = xs - local_cam
+            arr[base_idx, 1] = ys
+            tuft_idx = base_idx[blade] + 1
+            arr[tuft_idx, 0] = arr[base_idx[blade], 0] + spacing * 0.35
+            arr[tuft_idx, 1] = ys[blade] - spike_h[blade]
+            if len(arr) < 2:
                 continue
             # Optional smoothing iterations to soften jagged spikes
             smooth_steps = max(0, getattr(config, 'FOREGROUND_SMOOTH_STEPS', 0))
             for _ in range(smooth_steps):
-                new_pts = [pts[0]]
-                for a, b in zip(pts, pts[1:]):
-                    mx = (a[0] + b[0]) * 0.5
-                    my = (a[1] + b[1]) * 0.5
-                    new_pts.append((mx, my))
-                    new_pts.append(b)
-                pts = new_pts
+                # Midpoint insertion: originals on even slots, segment midpoints on odd slots
+                out = np.empty((2 * len(arr) - 1, 2))
+                out[0::2] = arr
+                out[1::2] = (arr[:-1] + arr[1:]) * 0.5
+                arr = out
+            pts = [tuple(p) for p in arr.tolist()]
             poly = pts.copy()
             poly.append((pts[-1][0], baseline + 12))
             poly.append((pts[0][0], baseline + 12))
+            # draw.polygon writes RGBA directly; gfxdraw would alpha-blend into the transparent fg_surf
             pygame.draw.polygon(fg_surf, (*color, alpha), poly, 0)
             # Gradient highlight along top crest (sample max y among pts)
             if getattr(config, 'FOREGROUND_TOP_GRADIENT_ALPHA', 0) > 0:
                 grad_alpha = getattr(config, 'FOREGROUND_TOP_GRADIENT_ALPHA', 80)
-                for i in range(len(pts) - 1):
-                    p1 = pts[i]
-                    p2 = pts[i + 1]
-                    # Light line
-                    pygame.draw.line(fg_surf, (int(color[0] * blade_boost), int(color[1] * blade_boost), int(color[2] * blade_boost), int(grad_alpha * 0.55)), p1, p2, 1)
-        surface.blit(fg_surf, (0,0))
-        self._fg_surface = fg_surf
-        self._fg_cache[key] = fg_surf
+                # Anti-aliased crest in a single call. aalines only encodes coverage correctly on a
+                # transparent layer of the same colour, so draw into a crest-height strip and blend it on.
+                hl_rgb = tuple(min(255, int(c * blade_boost)) for c in color)
+                top = int(min(p[1] for p in pts)) - 1
+                strip = pygame.Surface((w, int(max(p[1] for p in pts)) - top + 3), pygame.SRCALPHA)
+                strip.fill((*hl_rgb, 0))
+                pygame.draw.aalines(strip, (*hl_rgb, int(grad_alpha * 0.55)), False, [(x, y - top) for x, y in pts])
+                fg_surf.blit(strip, (0, top))
+        return _display_alpha(fg_surf)
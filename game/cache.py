@@ -0,0 +1,38 @@
+"""Small bounded caches for baked surfaces.
+
+Most visual caches are keyed by quantized camera / day_t buckets and would
+otherwise grow for the whole session. ``LRUCache`` keeps the most recently
+used ``maxsize`` entries and evicts the oldest on insert.
+
+Usage:
+    cache = LRUCache(maxsize=32)
+    surf = cache.get_or_build(key, lambda: expensive_bake())
+"""
+from __future__ import annotations
+from collections import OrderedDict
+
+
+class LRUCache(OrderedDict):
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = max(1, int(maxsize))
+
+    def lookup(self, key):
+        """Return the cached value (marking it recently used) or None."""
+        value = self.get(key)
+        if value is not None:
+            self.move_to_end(key)
+        return value
+
+    def store(self, key, value):
+        self[key] = value
+        self.move_to_end(key)
+        while len(self) > self.maxsize:
+            self.popitem(last=False)
+        return value
+
+    def get_or_build(self, key, build):
+        value = self.lookup(key)
+        if value is None:
+            value = self.store(key, build())
+        return value
@@ -17,8 +17,10 @@ ALLOW_NEGATIVE_CHUNKS = True   # allow terrain generation to the left of x=0
 INITIAL_LEFT_CHUNKS = 3        # how many negative chunks to guarantee at start (if allowed)
 PREFETCH_CHUNKS_AHEAD = 12     # how many chunks beyond right edge of screen to keep generated
 PREFETCH_CHUNKS_BEHIND = 2     # how many chunks behind camera to retain (>=1 for safety)
-ASYNC_TERRAIN_THREAD = False   # future option: generate terrain in background thread
+ASYNC_TERRAIN_THREAD = True    # sample noise for chunks ahead of the camera on background threads
+TERRAIN_WORKERS = 2            # worker threads used when ASYNC_TERRAIN_THREAD is on
 MAX_CHUNKS_PER_FRAME = 3       # cap synchronous chunk generations per frame to avoid spikes
+TERRAIN_CHUNK_CACHE_SIZE = PREFETCH_CHUNKS_AHEAD + PREFETCH_CHUNKS_BEHIND + 8  # raw chunk samples kept (LRU), incl. pruned
 
 # Terrain smoothing (Catmull-Rom on ridge)
 TERRAIN_SMOOTHING_ENABLED = True
@@ -43,6 +45,7 @@ PARALLAX_LAYERS = [
     {"scale": 0.12, "amplitude": 25, "color": (25, 60, 40), "speed_factor": 0.15},
 ]
 PARALLAX_POINT_SPACING = 48
+PARALLAX_CACHE_STRIDE = 32  # camera pixels per bucket for reusing parallax hill outlines (keep stride * speed_factor < 100)
 
 # Foreground silhouettes (close decorative grass/foliage bands for depth)
 FOREGROUND_SILHOUETTES_ENABLED = True
@@ -60,6 +63,7 @@ FOREGROUND_GRASS_BLADE_CHANCE = 0.12  # probability per segment to add a blade t
 FOREGROUND_GRASS_COLOR_BOOST = 1.35   # saturation/light boost for blade tips
 FOREGROUND_SMOOTH_STEPS = 1           # fewer smoothing subdivision passes
 FOREGROUND_CACHE_STRIDE = 48          # pixels per cache bucket for silhouettes
+FOREGROUND_CACHE_SIZE = 32            # max cached silhouette surfaces (LRU)
 FOREGROUND_TOP_GRADIENT_ALPHA = 95    # max extra highlight alpha at crest
 FOREGROUND_MAX_FPS_IMPACT = True      # if True, skip redraw when camera moved < 1 px within frame
 FOREGROUND_ALPHA = 165                # (override earlier) final fill alpha; slightly lower for subtlety
@@ -87,6 +91,7 @@ TERRAIN_NIGHT_COLOR = (30, 90, 70)
 RIDGE_HIGHLIGHT_COLOR = (180, 225, 170)
 RIDGE_HIGHLIGHT_ALPHA = 110
 RIDGE_SHADOW_ALPHA = 70
+TERRAIN_EDGE_ALPHA_STEP = 4  # ridge line alphas rounded to this step so equal runs batch into one polyline
 BIOME_BAND_WIDTH = 8 * CHUNK_WIDTH  # distance over which biome color shifts
 BIOME_COLOR_VARIANTS = [
     (60, 150, 80),
@@ -105,6 +110,8 @@ STAR_COLOR = (240, 240, 255)
 STAR_MIN_ALPHA = 30
 STAR_MAX_ALPHA = 180
 STAR_NIGHT_POWER = 1.6  # how sharply stars fade in (higher = later)
+STAR_ALPHA_STEPS = 32   # quantized alpha levels for pre-filled star surfaces
+STAR_JIT_THRESHOLD = 2000  # star count at which twinkle uses the Numba kernel (if installed)
 
 # Clouds
 CLOUD_ENABLED = True
@@ -114,6 +121,8 @@ CLOUD_ALPHA = 60
 CLOUD_SPEEDS = [12, 25]
 CLOUD_SCALE_RANGE = (0.6, 1.4)
 CLOUD_DENSITY = 9
+CLOUD_TINT_CACHE_STEPS = 64  # quantized day_t buckets for cached tinted cloud blobs
+CLOUD_TINT_CACHE_SIZE = 128  # max cached tinted blobs (LRU)
 
 # Fog / horizon depth
 FOG_ENABLED = True
@@ -129,6 +138,8 @@ SUN_HIGHLIGHT_STRENGTH = 0.9
 
 # Performance / visual caching
 SKY_BLEND_CACHE_STEPS = 240  # number of discrete cached sky blend states per full day-night cycle
+SKY_CACHE_SIZE = 256  # max cached (H, 3) sky row tables (LRU); covers every blend step
+CELESTIAL_LUT_STEPS = 1024  # precomputed sun/moon arc positions per day cycle (~1 px apart)
 
 # Star twinkle
 STAR_TWINKLE_SPEED = 0.4      # base speed multiplier for twinkle animation
@@ -146,6 +157,7 @@ CLOUD_TINT_NIGHT = (0.8, 0.85, 1.05)
 FOG_TWILIGHT_ENABLED = True
 FOG_TWILIGHT_WARM = (225, 190, 150)  # warm hue near horizon at sunrise/sunset
 FOG_TWILIGHT_SPAN = 0.18  # fraction of day_t near 0 and 1 edges (wrap) to apply warm blend
+FOG_TWILIGHT_STEPS = 32   # quantization of the warm blend factor (bounds fog cache keys)
 
 # Cloud soft edges
 CLOUD_SOFT_EDGES = True
@@ -172,9 +184,12 @@ HAZE_BANDS_ENABLED = True
 HAZE_BAND_COUNT = 3
 HAZE_BAND_ALPHA = 18
 HAZE_BAND_NOISE_SCALE = 0.002
+HAZE_TINT_CACHE_STEPS = 48  # quantized day_t buckets for cached tinted haze bands
+HAZE_TINT_CACHE_SIZE = 64   # max cached tinted haze bands (LRU)
 
 # Fog gradient caching
 FOG_CACHE_STEPS = 160
+FOG_CACHE_SIZE = 32  # max cached fog gradients (LRU)
 
 # Player visual style
 PLAYER_CAPSULE_ENABLED = True
@@ -197,6 +212,8 @@ PLAYER_TINT_COOL = (160, 190, 255)   # deep night cool tint multiplier target
 PLAYER_TINT_DAY = (255, 255, 255)    # midday neutral
 PLAYER_TINT_DAWN_SPAN = 0.12         # fraction of day_t near 0/1 for warm blend
 PLAYER_TINT_NIGHT_STRENGTH = 0.55    # strength of cool tint at deepest night (0..1)
+PLAYER_TINT_CACHE_STEPS = 64         # quantized day_t buckets for cached tinted frames
+PLAYER_TINT_CACHE_SIZE = 128         # max cached tinted frames (LRU)
 
 # Jump dust particles
 JUMP_DUST_ENABLED = True
@@ -204,6 +221,7 @@ DUST_PARTICLE_COUNT = 10
 DUST_PARTICLE_LIFETIME = 0.45
 DUST_PARTICLE_SIZE_RANGE = (4, 10)
 DUST_PARTICLE_COLOR = (230, 225, 215)
+DUST_MAX_PARTICLES = 64  # capacity of the preallocated particle buffer
 
 # Lightning flash (night)
 LIGHTNING_ENABLED = True
@@ -223,4 +241,5 @@ GOD_RAY_SPAN_DAYT = 0.08  # fraction of day_t window around sunrise (near 0.0)
 # Sun glow tuning
 SUN_GLOW_SCALE = 1.8        # multiplier of sun radius for outer glow radius
 SUN_GLOW_MAX_ALPHA = 65     # peak per-ring alpha factor (lower => subtler glow)
+SUN_GLOW_CACHE_SIZE = 16    # max cached glow surfaces (LRU)
 SUN_GLOW_ENABLED = False    # disable if visual style unwanted
@@ -0,0 +1,30 @@
+"""Optional Numba acceleration.
+
+Numba is not a hard dependency. When it is installed, ``njit`` and ``prange``
+are the real Numba objects; otherwise ``njit`` degrades to a no-op decorator
+and ``prange`` to ``range`` so the same kernels run as plain Python.
+
+Usage:
+    from .jit import njit, prange, NUMBA_AVAILABLE
+
+    @njit(cache=True, fastmath=True)
+    def kernel(xs):
+        ...
+"""
+from __future__ import annotations
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on environment
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        # Support both @njit and @njit(...) forms
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def wrap(fn):
+            return fn
+        return wrap
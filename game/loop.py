@@ -3,7 +3,18 @@ from . import config
 from .terrain import TerrainManager
 from .player import Player
 from .background import ParallaxBackground
+from .cache import LRUCache
+from .jit import njit, prange, NUMBA_AVAILABLE
 import math
+import numpy as np
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _star_alpha_kernel(phases, speeds, base_as, time_s, tw_speed, tw_amp, nf, out):
+    # Same twinkle/alpha math as the NumPy path in draw_background, fused into one pass
+    for i in prange(phases.shape[0]):
+        tw = (math.sin(phases[i] + time_s * speeds[i] * tw_speed) + 1.0) * 0.5
+        out[i] = int(base_as[i] * nf * (1.0 + tw_amp * (tw - 0.5)))
 
 class Game:
     def __init__(self, seed: int | None = None):
@@ -20,21 +31,25 @@ class Game:
         self.parallax = ParallaxBackground(self.seed)
         self.camera_bob_offset = 0.0
         self._bob_phase = 0.0
-        # Gradient surfaces for day and night; we blend each frame
+        # Gradient surfaces for day and night; their rows are blended on sky bucket changes
         self._bg_day = self._build_gradient(getattr(config, 'DAY_COLOR_TOP', config.COLOR_BG_TOP),
                                             getattr(config, 'DAY_COLOR_BOTTOM', config.COLOR_BG_BOTTOM))
         self._bg_night = self._build_gradient(getattr(config, 'NIGHT_COLOR_TOP', config.COLOR_BG_TOP),
                                               getattr(config, 'NIGHT_COLOR_BOTTOM', config.COLOR_BG_BOTTOM))
         self._bg_surface = pygame.Surface((config.WINDOW_WIDTH, config.WINDOW_HEIGHT)).convert()
-        # Precompute per-row color tuples for faster blending
-        self._bg_day_rows = [self._bg_day.get_at((0, y)) for y in range(config.WINDOW_HEIGHT)]
-        self._bg_night_rows = [self._bg_night.get_at((0, y)) for y in range(config.WINDOW_HEIGHT)]
+        # Precompute per-row colours as (H, 3) arrays for vectorized blending
+        # Column 0 of pixels3d is the (H, 3) row colour table; astype copies, so the lock is released right away
+        self._bg_day_arr = pygame.surfarray.pixels3d(self._bg_day)[0].astype(np.float32)
+        self._bg_night_arr = pygame.surfarray.pixels3d(self._bg_night)[0].astype(np.float32)
+        self._bg_delta_arr = self._bg_day_arr - self._bg_night_arr  # blend = night + delta * t
+        # Only the row tables are used from here on; free the two full-screen gradient surfaces
+        del self._bg_day, self._bg_night
         # Sky blend caching
-        self._sky_cache = {}
+        self._sky_cache = LRUCache(getattr(config, 'SKY_CACHE_SIZE', 256))
         self._sky_last_bucket = None
-        # Stars (static positions + twinkle phase/speed)
+        # Stars (static positions + twinkle phase/speed), stored as parallel arrays below
         import random
-        self._stars = []
+        stars = []
         if hasattr(config, 'STAR_COUNT'):
             rng = random.Random(self.seed * 9991)
             for _ in range(config.STAR_COUNT):
@@ -43,7 +58,14 @@ class Game:
                 a = rng.randint(getattr(config, 'STAR_MIN_ALPHA', 40), getattr(config, 'STAR_MAX_ALPHA', 160))
                 phase = rng.random() * math.tau
                 speed = 0.6 + rng.random() * 0.8
-                self._stars.append((x, y, a, phase, speed))
+                stars.append((x, y, a, phase, speed))
+        cols = np.array(stars, dtype=np.float64).reshape(-1, 5).T
+        self._star_x = cols[0].astype(np.int32)
+        self._star_y = cols[1].astype(np.int32)
+        self._star_base_a, self._star_phase, self._star_speed = cols[2], cols[3], cols[4]
+        # Large star fields use the fused JIT kernel; for small ones its dispatch costs more than NumPy
+        self._star_use_jit = NUMBA_AVAILABLE and self._star_x.size >= getattr(config, 'STAR_JIT_THRESHOLD', 2000)
+        self._star_alpha = np.empty(self._star_x.size, dtype=np.int32)
         self.font = pygame.font.SysFont("consolas", 16)
         # Pre-generate initial left-side terrain if enabled
         if config.ALLOW_NEGATIVE_CHUNKS and getattr(config, "INITIAL_LEFT_CHUNKS", 0) > 0:
@@ -54,8 +76,52 @@ class Game:
         self._next_lightning = self._schedule_lightning()
         self._active_flash = 0.0  # time remaining of current flash
         self._bolt_points = []
+        # Reused overlay buffers: the bolt layer is kept fully transparent between uses and the
+        # flash is a flat colour, so it only needs its surface alpha updated per frame
+        self._bolt_surf = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
+        self._flash_surf = pygame.Surface(self.screen.get_size()).convert()
+        self._flash_surf.fill((210, 230, 255))
         # Sun glow cache
-        self._sun_glow_cache = {}
+        self._sun_glow_cache = LRUCache(getattr(config, 'SUN_GLOW_CACHE_SIZE', 16))
+        # Config values read every frame, resolved once here instead of per-frame getattr lookups
+        self._cfg_lightning_enabled = getattr(config, 'LIGHTNING_ENABLED', False)
+        self._cfg_lightning_duration = getattr(config, 'LIGHTNING_FLASH_DURATION', 0.35)
+        self._cfg_lightning_alpha = getattr(config, 'LIGHTNING_FLASH_ALPHA', 120)
+        self._cfg_fog_hf = getattr(config, 'FOG_HEIGHT_FRACTION', 0.55)
+        self._cfg_bob_enabled = getattr(config, 'CAMERA_BOB_ENABLED', False)
+        self._cfg_bob_speed = getattr(config, 'CAMERA_BOB_SPEED', 1.2)
+        self._cfg_bob_amplitude = getattr(config, 'CAMERA_BOB_AMPLITUDE', 6.0)
+        self._cfg_day_night_enabled = getattr(config, 'DAY_NIGHT_ENABLED', False)
+        self._cfg_day_night_duration = getattr(config, 'DAY_NIGHT_DURATION', 60.0)
+        self._day_t = self._day_night_factor()  # refreshed once per frame in update()
+        self._cfg_sky_steps = max(1, getattr(config, 'SKY_BLEND_CACHE_STEPS', 240))
+        self._cfg_star_power = getattr(config, 'STAR_NIGHT_POWER', 1.5)
+        self._cfg_star_color = getattr(config, 'STAR_COLOR', (240, 240, 255))
+        self._cfg_star_tw_amp = getattr(config, 'STAR_TWINKLE_AMPLITUDE', 0.3)
+        self._cfg_star_tw_speed = getattr(config, 'STAR_TWINKLE_SPEED', 0.4)
+        # One pre-filled 2x2 star surface per quantized alpha level (index = alpha * steps >> 8)
+        star_steps = max(1, getattr(config, 'STAR_ALPHA_STEPS', 32))
+        self._star_surfs = []
+        for i in range(star_steps):
+            star_surf = pygame.Surface((2, 2), pygame.SRCALPHA)
+            star_surf.fill((*self._cfg_star_color, ((2 * i + 1) * 256) // (2 * star_steps)))
+            self._star_surfs.append(star_surf)
+        self._cfg_sun_glow = hasattr(config, 'SUN_RADIUS') and getattr(config, 'SUN_GLOW_ENABLED', True)
+        self._cfg_sun_glow_scale = getattr(config, 'SUN_GLOW_SCALE', 1.8)
+        self._cfg_sun_glow_alpha = getattr(config, 'SUN_GLOW_MAX_ALPHA', 65)
+        self._cfg_sun_color = getattr(config, 'SUN_COLOR', (255, 245, 200))
+        # Sun/moon arc positions per day_t step: (sun_x, sun_y, moon_x, moon_y)
+        cx = config.WINDOW_WIDTH * 0.5
+        cy = config.WINDOW_HEIGHT * 0.15
+        arc_radius = config.WINDOW_HEIGHT * 0.55
+        angle = np.linspace(0.0, 1.0, max(2, getattr(config, 'CELESTIAL_LUT_STEPS', 1024))) * math.pi  # 0..pi across sky for sun
+        moon_angle = angle + math.pi
+        self._celestial_lut = list(zip(
+            (cx + np.cos(angle - math.pi) * arc_radius).tolist(),
+            (cy + np.sin(angle - math.pi) * arc_radius * 0.35).tolist(),
+            (cx + np.cos(moon_angle - math.pi) * arc_radius).tolist(),
+            (cy + np.sin(moon_angle - math.pi) * arc_radius * 0.35).tolist(),
+        ))
 
     def _schedule_lightning(self):
         import random
@@ -65,14 +131,14 @@ class Game:
     def _spawn_lightning(self):
         # Build a jagged bolt path from top to horizon/fog baseline
         import random
-        if not getattr(config, 'LIGHTNING_ENABLED', False):
+        if not self._cfg_lightning_enabled:
             return
         # Only at night (after day factor threshold)
-        if self._day_night_factor() > 0.35:
+        if self._day_t > 0.35:
             return
         w = config.WINDOW_WIDTH
         h = config.WINDOW_HEIGHT
-        base_y = h * getattr(config, 'FOG_HEIGHT_FRACTION', 0.55)
+        base_y = h * self._cfg_fog_hf
         x = random.randint(int(self.camera_x) - 200, int(self.camera_x) + w + 200)
         segs = random.randint(6, 10)
         points = []
@@ -86,22 +152,21 @@ class Game:
             cur_x, cur_y = nx, ny
             lateral_span *= 0.6
         self._bolt_points = points
-        self._active_flash = getattr(config, 'LIGHTNING_FLASH_DURATION', 0.35)
+        self._active_flash = self._cfg_lightning_duration
         self._lightning_time = 0.0
         self._next_lightning = self._schedule_lightning()
 
     def _build_gradient(self, top, bottom) -> pygame.Surface:
         surf = pygame.Surface((config.WINDOW_WIDTH, config.WINDOW_HEIGHT))
         h = config.WINDOW_HEIGHT
-        # Draw vertical gradient once
-        for y in range(h):
-            t = y / h
-            r = int(top[0] * (1 - t) + bottom[0] * t)
-            g = int(top[1] * (1 - t) + bottom[1] * t)
-            b = int(top[2] * (1 - t) + bottom[2] * t)
-            # Single line fill
-            pygame.draw.line(surf, (r, g, b), (0, y), (config.WINDOW_WIDTH, y))
-        return surf.convert()
+        # Vertical gradient: one (h, 3) row-colour table broadcast across the width
+        t = (np.arange(h) / h)[:, None]
+        rows = (np.asarray(top[:3], dtype=np.float64) * (1 - t) + np.asarray(bottom[:3], dtype=np.float64) * t).astype(np.uint8)
+        pixels = pygame.surfarray.pixels3d(surf)
+        pixels[:] = rows[None, :, :]  # surfarray is (x, y)
+        del pixels  # release surface lock
+        # No convert(): these surfaces are only read back as row tables, never blitted
+        return surf
 
     def handle_events(self):
         for event in pygame.event.get():
@@ -118,108 +183,100 @@ class Game:
 
     def update(self, dt):
         self.time += dt
+        self._day_t = self._day_night_factor()
         self.player.update(dt)
         self.update_camera(dt)
         # Lightning timing
-        if getattr(config, 'LIGHTNING_ENABLED', False):
+        if self._cfg_lightning_enabled:
             self._lightning_time += dt
             if self._lightning_time >= self._next_lightning:
                 self._spawn_lightning()
             if self._active_flash > 0:
                 self._active_flash -= dt
         # Camera bob (visual only)
-        if getattr(config, 'CAMERA_BOB_ENABLED', False):
+        if self._cfg_bob_enabled:
             speed = abs(self.player.vx)
             norm = min(1.0, speed / max(1.0, config.PLAYER_MOVE_SPEED))
-            self._bob_phase += dt * getattr(config, 'CAMERA_BOB_SPEED', 1.2) * (0.3 + 0.7 * norm)
-            amp = getattr(config, 'CAMERA_BOB_AMPLITUDE', 6.0) * norm
+            self._bob_phase += dt * self._cfg_bob_speed * (0.3 + 0.7 * norm)
+            amp = self._cfg_bob_amplitude * norm
             self.camera_bob_offset = math.sin(self._bob_phase * math.tau) * amp
         else:
             self.camera_bob_offset = 0.0
 
     def _day_night_factor(self) -> float:
-        if not getattr(config, 'DAY_NIGHT_ENABLED', False):
+        if not self._cfg_day_night_enabled:
             return 0.0
-        period = getattr(config, 'DAY_NIGHT_DURATION', 60.0)
+        period = self._cfg_day_night_duration
         phase = (self.time / period) * math.tau  # 0..2pi
         # sin gives -1..1; map to 0..1 (0 = night, 1 = day) or invert? choose (sin+1)/2
         return (math.sin(phase) + 1.0) * 0.5
 
-    def draw_background(self):
-        t = self._day_night_factor()
+    def draw_background(self, t: float):
         # Sky blend caching with quantization
-        steps = max(1, getattr(config, 'SKY_BLEND_CACHE_STEPS', 240))
+        steps = self._cfg_sky_steps
         bucket = int(t * (steps - 1))
+        # _bg_surface already holds the current bucket; only touch it when the bucket changes
         if bucket != self._sky_last_bucket:
-            day_rows = self._bg_day_rows
-            night_rows = self._bg_night_rows
-            draw_line = pygame.draw.line
-            w = config.WINDOW_WIDTH
-            for y in range(config.WINDOW_HEIGHT):
-                d = day_rows[y]
-                n = night_rows[y]
-                r = (n.r * (1 - t) + d.r * t)
-                g = (n.g * (1 - t) + d.g * t)
-                b = (n.b * (1 - t) + d.b * t)
-                draw_line(self._bg_surface, (int(r), int(g), int(b)), (0, y), (w, y))
-            self._sky_cache[bucket] = self._bg_surface.copy()
+            # The sky is constant across x, so only the (H, 3) row colours are cached per bucket
+            blend = self._sky_cache.lookup(bucket)
+            if blend is None:
+                blend = self._sky_cache.store(bucket, (self._bg_night_arr + self._bg_delta_arr * t).astype(np.uint8))
+            pixels = pygame.surfarray.pixels3d(self._bg_surface)
+            pixels[:] = blend[None, :, :]  # surfarray is (x, y)
+            del pixels  # release surface lock
             self._sky_last_bucket = bucket
-        else:
-            cached = self._sky_cache.get(bucket)
-            if cached:
-                self._bg_surface.blit(cached, (0, 0))
         self.screen.blit(self._bg_surface, (0, 0))
         # (God rays removed due to visual artifacts and performance impact. Keeping code out for clarity.)
         # Stars (fade in at night)
-        if self._stars:
+        if self._star_x.size:
             night_factor = 1.0 - t  # 1 at night
-            power = getattr(config, 'STAR_NIGHT_POWER', 1.5)
-            nf = night_factor ** power
-            star_color = getattr(config, 'STAR_COLOR', (240, 240, 255))
-            tw_amp = getattr(config, 'STAR_TWINKLE_AMPLITUDE', 0.3)
-            tw_speed = getattr(config, 'STAR_TWINKLE_SPEED', 0.4)
-            for x, y, base_a, phase, speed in self._stars:
-                # Twinkle factor (0..1)
-                tw = (math.sin(phase + self.time * speed * tw_speed) + 1) * 0.5
-                a = int(base_a * nf * (1.0 + tw_amp * (tw - 0.5)))
-                if a <= 2:
-                    continue
-                star_surf = pygame.Surface((2, 2), pygame.SRCALPHA)
-                star_surf.fill((*star_color, a))
-                self.screen.blit(star_surf, (x, y))
-        # Sun & Moon positions (on a simple arc)
-        cx = config.WINDOW_WIDTH * 0.5
-        cy = config.WINDOW_HEIGHT * 0.15
-        arc_radius = config.WINDOW_HEIGHT * 0.55
-        angle = (t) * math.pi  # 0..pi across sky for sun
-        sun_x = cx + math.cos(angle - math.pi) * arc_radius
-        sun_y = cy + math.sin(angle - math.pi) * arc_radius * 0.35
-        moon_angle = angle + math.pi
-        moon_x = cx + math.cos(moon_angle - math.pi) * arc_radius
-        moon_y = cy + math.sin(moon_angle - math.pi) * arc_radius * 0.35
+            nf = night_factor ** self._cfg_star_power
+            tw_amp = self._cfg_star_tw_amp
+            tw_speed = self._cfg_star_tw_speed
+            star_surfs = self._star_surfs
+            steps = len(star_surfs)
+            # Twinkle factor (0..1) and alpha for every star at once
+            if self._star_use_jit:
+                a = self._star_alpha
+                _star_alpha_kernel(self._star_phase, self._star_speed, self._star_base_a, self.time, tw_speed, tw_amp, nf, a)
+            else:
+                tw = (np.sin(self._star_phase + self.time * self._star_speed * tw_speed) + 1) * 0.5
+                a = (self._star_base_a * nf * (1.0 + tw_amp * (tw - 0.5))).astype(np.int32)
+            vis = a > 2
+            levels = (np.minimum(a[vis], 255) * steps >> 8).tolist()
+            batch = [(star_surfs[i], pos) for i, pos in zip(levels, zip(self._star_x[vis].tolist(), self._star_y[vis].tolist()))]
+            # Single C-level call for all visible stars (pygame 2.x has no fblits)
+            self.screen.blits(batch, doreturn=False)
+        # Sun & Moon positions (on a simple arc), looked up from the precomputed table
+        sun_x, sun_y, moon_x, moon_y = self._celestial_lut[int(t * (len(self._celestial_lut) - 1) + 0.5)]
         # Radial sun glow (cheap, cached by radius & day factor bucket)
-        if hasattr(config, 'SUN_RADIUS') and getattr(config, 'SUN_GLOW_ENABLED', True):
-            glow_scale = getattr(config, 'SUN_GLOW_SCALE', 1.8)
-            max_alpha = getattr(config, 'SUN_GLOW_MAX_ALPHA', 65)
+        if self._cfg_sun_glow:
+            glow_scale = self._cfg_sun_glow_scale
+            max_alpha = self._cfg_sun_glow_alpha
             glow_outer = int(config.SUN_RADIUS * glow_scale)
             # Quantize brightness to reduce cache size
             glow_steps = 48
             sun_brightness = int(t * (glow_steps - 1))
             key = (glow_outer, sun_brightness)
-            glow = self._sun_glow_cache.get(key)
+            glow = self._sun_glow_cache.lookup(key)
             if glow is None:
-                glow = pygame.Surface((glow_outer * 2, glow_outer * 2), pygame.SRCALPHA)
-                center = glow_outer
+                size = glow_outer * 2
+                glow = pygame.Surface((size, size), pygame.SRCALPHA)
                 # Base color slightly warm
-                base_col = getattr(config, 'SUN_COLOR', (255, 245, 200))
-                for r in range(glow_outer, 0, -1):
-                    k = r / glow_outer
-                    # Outer falloff steeper for edge softness
-                    a = int(max_alpha * (k ** 1.9) * (0.55 + 0.45 * t))
-                    if a <= 0:
-                        continue
-                    pygame.draw.circle(glow, (*base_col, a), (center, center), r)
-                self._sun_glow_cache[key] = glow
+                glow.fill((*self._cfg_sun_color, 0))
+                # Ring alpha per integer radius (index 0 unused, R+1 = outside the glow)
+                radii = np.arange(glow_outer + 2) / glow_outer
+                # Outer falloff steeper for edge softness
+                ring_alpha = (max_alpha * radii ** 1.9 * (0.55 + 0.45 * t)).astype(np.uint8)
+                ring_alpha[-1] = 0
+                # Each pixel takes the innermost ring covering its centre, as the old
+                # outer-to-inner draw.circle overdraw did
+                c = np.arange(size) - glow_outer + 0.5
+                ring = np.minimum(np.floor(np.hypot(c[:, None], c[None, :])) + 1, glow_outer + 1).astype(np.intp)
+                alpha = pygame.surfarray.pixels_alpha(glow)
+                alpha[:] = ring_alpha[ring]  # symmetric, so (x, y) order does not matter
+                del alpha  # release surface lock
+                self._sun_glow_cache.store(key, glow)
             self.screen.blit(glow, (sun_x - glow.get_width() / 2, sun_y - glow.get_height() / 2), special_flags=pygame.BLEND_PREMULTIPLIED)
         if hasattr(config, 'SUN_RADIUS'):
             pygame.draw.circle(self.screen, config.SUN_COLOR, (int(sun_x), int(sun_y)), config.SUN_RADIUS)
@@ -232,25 +289,30 @@ class Game:
         self.parallax.draw(self.screen, self.camera_x, t)
         # Lightning bolt & flash overlay (after parallax, before terrain to illuminate ridge edges; simple approach)
         if self._active_flash > 0 and self._bolt_points:
-            fade = max(0.0, self._active_flash / getattr(config, 'LIGHTNING_FLASH_DURATION', 0.35))
-            alpha = int(getattr(config, 'LIGHTNING_FLASH_ALPHA', 120) * (fade ** 0.6))
+            fade = max(0.0, self._active_flash / self._cfg_lightning_duration)
+            alpha = int(self._cfg_lightning_alpha * (fade ** 0.6))
             # Bolt path in screen space
             bolt_color = (255, 255, 255)
-            # Draw on temp surface for alpha
-            bolt_surf = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
+            # Draw on the reused alpha layer, tracking the touched area
+            bolt_surf = self._bolt_surf
+            dirty = None
             last = None
             cam = self.camera_x
+            w = self.screen.get_width()
             for pt in self._bolt_points:
                 sx = pt[0] - cam
                 sy = pt[1]
-                if last is not None:
-                    pygame.draw.line(bolt_surf, (*bolt_color, alpha), last, (sx, sy), 2)
+                # Skip segments entirely left or right of the screen (bolts span the full height)
+                if last is not None and not ((sx < 0 and last[0] < 0) or (sx > w and last[0] > w)):
+                    r = pygame.draw.line(bolt_surf, (*bolt_color, alpha), last, (sx, sy), 2)
+                    dirty = r if dirty is None else dirty.union(r)
                 last = (sx, sy)
+            if dirty is not None:
+                self.screen.blit(bolt_surf, dirty.topleft, dirty)
+                bolt_surf.fill((0, 0, 0, 0), dirty)  # leave the layer clear for the next frame
             # Global flash overlay (tinted slightly blue-white)
-            flash = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
-            flash.fill((210, 230, 255, int(alpha * 0.55)))
-            self.screen.blit(bolt_surf, (0, 0))
-            self.screen.blit(flash, (0, 0))
+            self._flash_surf.set_alpha(int(alpha * 0.55))
+            self.screen.blit(self._flash_surf, (0, 0))
 
     def draw_hud(self):
         if not config.HUD_ENABLED:
@@ -270,23 +332,14 @@ class Game:
             y += surf.get_height() + 2
 
     def draw(self):
-        self.draw_background()
-        # Draw terrain
-        # Apply bob via a temporary surface if offset non-zero
-        if self.camera_bob_offset != 0.0:
-            temp = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
-            day_t = self._day_night_factor()
-            self.terrain.draw(temp, self.camera_x, day_t)
-            if hasattr(self.parallax, 'draw_foreground'):
-                self.parallax.draw_foreground(temp, self.camera_x, day_t)
-            self.player.draw(temp, self.camera_x, day_t)
-            self.screen.blit(temp, (0, self.camera_bob_offset))
-        else:
-            day_t = self._day_night_factor()
-            self.terrain.draw(self.screen, self.camera_x, day_t)
-            if hasattr(self.parallax, 'draw_foreground'):
-                self.parallax.draw_foreground(self.screen, self.camera_x, day_t)
-            self.player.draw(self.screen, self.camera_x, day_t)
+        day_t = self._day_t
+        self.draw_background(day_t)
+        # Draw terrain, foreground and player straight to the screen, shifted by the camera bob
+        bob = int(self.camera_bob_offset)
+        self.terrain.draw(self.screen, self.camera_x, day_t, y_offset=bob)
+        if hasattr(self.parallax, 'draw_foreground'):
+            self.parallax.draw_foreground(self.screen, self.camera_x, day_t, y_offset=bob)
+        self.player.draw(self.screen, self.camera_x, day_t, y_offset=bob)
         self.draw_hud()
         pygame.display.flip()
 
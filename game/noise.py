@@ -1,12 +1,16 @@
 """Minimal 1D gradient noise (Perlin-like) with fractal octaves.
 
-We keep it lightweight: no external dependencies. The implementation
-produces deterministic results given a seed. Values are in [-1, 1].
+We keep it lightweight: the scalar API is pure Python and the batched
+API only needs NumPy. The implementation produces deterministic results
+given a seed. Values are in [-1, 1].
 
 Usage:
     noise = Noise1D(seed=1337)
     val = noise.noise(x)                   # single octave
     val2 = noise.fractal(x, octaves=4)     # multi-octave fractal noise
+    vals = noise.fractal_array(xs)         # same as fractal(), over a NumPy array
+    vals = fractal_noise1_array(xs)        # module-level batched helper (seed 1337)
+    fn = fractal_cfunc()                   # C-callable kernel (Numba only); see its docstring
 
 Approach:
 - Create a permutation table (hash) of size 256 duplicated to avoid wrapping logic.
@@ -18,55 +22,170 @@ Approach:
 Fractal layering (aka FBM):
 value = sum( noise(x * freq) * amp ) / sum(amp)
 where freq *= lacunarity (default 2.0) and amp *= persistence (default 0.5).
+
+When Numba is installed the scalar and batched paths run through
+JIT-compiled kernels (see ``game/jit.py``); otherwise the same kernel source
+runs as plain Python and the batched path uses NumPy.
 """
 from __future__ import annotations
 import random
-from typing import List
+import numpy as np
+
+from .jit import njit, prange, NUMBA_AVAILABLE
 
 _FADE = lambda t: t * t * t * (t * (t * 6 - 15) + 10)  # 6t^5 - 15t^4 + 10t^3
 _LERP = lambda a, b, t: a + (b - a) * t
 
+
+@njit(cache=True, fastmath=True)
+def _noise_kernel(x, grad):
+    # Single-octave noise; same arithmetic as one iteration of _fractal_kernel
+    xi = int(x)
+    x_rel = x - xi
+    x0 = xi & 255
+    x1 = (x0 + 1) & 255
+    g0 = grad[x0]
+    g1 = grad[x1]
+    d0 = g0 * x_rel
+    d1 = g1 * (x_rel - 1.0)
+    t = x_rel * x_rel * x_rel * (x_rel * (x_rel * 6 - 15) + 10)
+    return d0 + (d1 - d0) * t
+
+
+@njit(cache=True, fastmath=True)
+def _fractal_kernel(x, grad, octaves, lacunarity, persistence):
+    # Scalar FBM; fade/lerp are inlined so LLVM can fuse them. ``grad`` is the
+    # +/-1 gradient table: a list (pure Python fallback) or a float64 array (Numba).
+    total = 0.0
+    amplitude = 1.0
+    max_amp = 0.0
+    freq = 1.0
+    for _ in range(octaves):
+        xf = x * freq
+        xi = int(xf)
+        x_rel = xf - xi
+        x0 = xi & 255
+        x1 = (x0 + 1) & 255
+        g0 = grad[x0]
+        g1 = grad[x1]
+        d0 = g0 * x_rel
+        d1 = g1 * (x_rel - 1.0)
+        t = x_rel * x_rel * x_rel * (x_rel * (x_rel * 6 - 15) + 10)
+        total += (d0 + (d1 - d0) * t) * amplitude
+        max_amp += amplitude
+        amplitude *= persistence
+        freq *= lacunarity
+    return total / max_amp if max_amp else 0.0
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _fractal_vec_kernel(xs, grad, octaves, lacunarity, persistence):
+    out = np.empty(xs.shape[0])
+    for i in prange(xs.shape[0]):
+        out[i] = _fractal_kernel(xs[i], grad, octaves, lacunarity, persistence)
+    return out
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _fractal_vec_serial_kernel(xs, grad, octaves, lacunarity, persistence):
+    # Single-threaded variant that releases the GIL, for calling from worker threads
+    # (the parallel kernel's threading layer may not support concurrent launches)
+    out = np.empty(xs.shape[0])
+    for i in range(xs.shape[0]):
+        out[i] = _fractal_kernel(xs[i], grad, octaves, lacunarity, persistence)
+    return out
+
+_fractal_cfunc = None
+
+
+def fractal_cfunc():
+    """Return the FBM kernel compiled as a C callback, or None without Numba.
+
+    Signature: ``double f(double x, int64 octaves, double lacunarity, double persistence,
+    double *grad, int64 grad_len)`` where ``grad`` is a ``Noise1D.grad_table``. The result
+    has ``.address`` (for C extensions) and ``.ctypes``. Compiled on first use so importing
+    this module stays cheap. Also None when ``NUMBA_DISABLE_JIT`` is set.
+    """
+    global _fractal_cfunc
+    if _fractal_cfunc is None and NUMBA_AVAILABLE:
+        from numba import carray, cfunc, config as numba_config, types
+        if numba_config.DISABLE_JIT:  # kernels are plain Python; nothing to compile against
+            return None
+        sig = types.float64(types.float64, types.int64, types.float64, types.float64,
+                            types.CPointer(types.float64), types.int64)
+
+        @cfunc(sig, fastmath=True)
+        def kernel(x, octaves, lacunarity, persistence, grad_ptr, grad_len):
+            return _fractal_kernel(x, carray(grad_ptr, (grad_len,)), octaves, lacunarity, persistence)
+        _fractal_cfunc = kernel
+    return _fractal_cfunc
+
+
 class Noise1D:
     def __init__(self, seed: int = 0):
         rnd = random.Random(seed)
         p = list(range(256))
         rnd.shuffle(p)
         # Duplicate for overflow-less index wrap
-        self.perm: List[int] = p + p
+        self.perm: np.ndarray = np.asarray(p + p, dtype=np.int32)
+        # Gradient per hashed cell, precomputed so the kernels do a table load instead of a branch
+        self._grad_list = [self._grad(h) for h in p + p]
+        self._grad_arr = np.asarray(self._grad_list, dtype=np.float64)
+
+    @property
+    def grad_table(self) -> np.ndarray:
+        """Contiguous float64 gradient table (512 entries) used by the kernels."""
+        return self._grad_arr
 
     def _grad(self, hash_val: int) -> float:
         # In 1D gradients are just +1 or -1 (could add more variety if desired)
         return 1.0 if (hash_val & 1) == 0 else -1.0
 
     def noise(self, x: float) -> float:
-        # Find unit grid cell containing x
-        x0 = int(x) & 255
-        x_rel = x - int(x)
-        x1 = (x0 + 1) & 255
+        grad = self._grad_arr if NUMBA_AVAILABLE else self._grad_list
+        return _noise_kernel(float(x), grad)
 
-        # Gradients
-        g0 = self._grad(self.perm[x0])
-        g1 = self._grad(self.perm[x1])
-
-        # Dot products (in 1D this is gradient * distance)
+    def fractal(self, x: float, octaves: int = 4, lacunarity: float = 2.0, persistence: float = 0.5) -> float:
+        # List indexing is faster than ndarray indexing when the kernel runs as plain Python
+        grad = self._grad_arr if NUMBA_AVAILABLE else self._grad_list
+        return _fractal_kernel(float(x), grad, int(octaves), float(lacunarity), float(persistence))
+
+    def noise_array(self, xs) -> np.ndarray:
+        """Vectorized :meth:`noise`; returns one value per element of ``xs``."""
+        xs = np.asarray(xs, dtype=np.float64)
+        # Truncate toward zero like int() in the scalar path (matters for negative x)
+        xi = np.trunc(xs)
+        x_rel = xs - xi
+        x0 = xi.astype(np.int64) & 255
+        x1 = (x0 + 1) & 255
+        g0 = self._grad_arr[x0]
+        g1 = self._grad_arr[x1]
         d0 = g0 * x_rel
         d1 = g1 * (x_rel - 1.0)
-
-        # Smooth interpolation
         t = _FADE(x_rel)
         return _LERP(d0, d1, t)
 
-    def fractal(self, x: float, octaves: int = 4, lacunarity: float = 2.0, persistence: float = 0.5) -> float:
-        total = 0.0
+    def fractal_array(self, xs, octaves: int = 4, lacunarity: float = 2.0, persistence: float = 0.5,
+                      parallel: bool = True) -> np.ndarray:
+        """Vectorized :meth:`fractal`; matches the scalar result element-wise.
+
+        Pass ``parallel=False`` from worker threads: the Numba path then runs a serial
+        kernel that releases the GIL instead of launching its own thread pool.
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        if NUMBA_AVAILABLE and xs.ndim == 1:
+            kernel = _fractal_vec_kernel if parallel else _fractal_vec_serial_kernel
+            return kernel(xs, self._grad_arr, int(octaves), float(lacunarity), float(persistence))
+        total = np.zeros_like(xs)
         amplitude = 1.0
         max_amp = 0.0
         freq = 1.0
         for _ in range(octaves):
-            total += self.noise(x * freq) * amplitude
+            total += self.noise_array(xs * freq) * amplitude
             max_amp += amplitude
             amplitude *= persistence
             freq *= lacunarity
-        return total / max_amp if max_amp else 0.0
+        return total / max_amp if max_amp else total
 
 # Convenience singleton (can be replaced later if seed changes)
 _default_noise = Noise1D(seed=1337)
@@ -77,6 +196,9 @@ def noise1(x: float) -> float:
 def fractal_noise1(x: float, octaves: int = 4, lacunarity: float = 2.0, persistence: float = 0.5) -> float:
     return _default_noise.fractal(x, octaves=octaves, lacunarity=lacunarity, persistence=persistence)
 
+def fractal_noise1_array(xs, octaves: int = 4, lacunarity: float = 2.0, persistence: float = 0.5) -> np.ndarray:
+    return _default_noise.fractal_array(xs, octaves=octaves, lacunarity=lacunarity, persistence=persistence)
+
 if __name__ == "__main__":  # simple manual test
     n = Noise1D(42)
     for i in range(0, 10):
@@ -1,9 +1,47 @@
 from __future__ import annotations
 import pygame
 import math
+import numpy as np
 from . import config
+from .cache import LRUCache
+from .jit import njit
+
+# Particle attributes stored as parallel arrays (row order of Player._particles)
+_PX, _PY, _PVX, _PVY, _PAGE, _PLIFE, _PSIZE = range(7)
+
+# Shared generator for cosmetic randomness (dust); seeded once from OS entropy at import
+_RNG = np.random.default_rng()
+
+
+@njit(cache=True, fastmath=True)
+def _step_particles(parts, n, dt, gravity):
+    # Advance the first n particle columns and pack survivors to the front in the
+    # same pass (stable, so survivors keep their order); returns the new live count.
+    drag = 1 - 1.4 * dt
+    grow = 1 + 0.4 * dt
+    live = 0
+    for i in range(n):
+        age = parts[4, i] + dt
+        if age >= parts[5, i]:
+            continue
+        vx = parts[2, i]
+        vy = parts[3, i]
+        parts[0, live] = parts[0, i] + vx * dt
+        parts[1, live] = parts[1, i] + vy * dt
+        parts[2, live] = vx * drag
+        parts[3, live] = vy + gravity * dt * 0.2
+        parts[4, live] = age
+        parts[5, live] = parts[5, i]
+        parts[6, live] = parts[6, i] * grow
+        live += 1
+    return live
 
 class Player:
+    # Key codes resolved once instead of per-frame pygame attribute lookups
+    _K_LEFT, _K_A = pygame.K_LEFT, pygame.K_a
+    _K_RIGHT, _K_D = pygame.K_RIGHT, pygame.K_d
+    _K_SPACE, _K_UP, _K_W = pygame.K_SPACE, pygame.K_UP, pygame.K_w
+
     def __init__(self, terrain):
         # World position references the player's feet (x, y at ground contact)
         self.x = 0.0
@@ -12,19 +50,42 @@ class Player:
         self.vy = 0.0
         self.terrain = terrain
         self.on_ground = False
-        # Particles
-        self.particles = []  # list of dicts
+        # Particles: one fixed (7, capacity) float array, rows indexed by _PX.._PSIZE; the
+        # first _n_particles columns are live
+        self._particles = np.zeros((7, max(1, getattr(config, 'DUST_MAX_PARTICLES', 64))))
+        self._n_particles = 0
+        self._dust_color = getattr(config, 'DUST_PARTICLE_COLOR', (230, 225, 215))
+        self._dust_lut = {}  # (size, alpha level, color) -> pre-baked premultiplied disc
         self._was_on_ground = False
+        # Last terrain sample; reused while standing still on the ground
+        self._last_sample_x = None
+        self._last_ground_y = 0.0
         # Cached visuals
         self._body_cache = None
-        self._shadow_cache = None
         self._last_size_key = None
+        self._prev_rect = None  # screen-space bounds drawn last frame (for dirty-rect updates)
+        # Tinted frames keyed by (frame identity key, quantized day_t bucket)
+        self._tint_cache = LRUCache(getattr(config, 'PLAYER_TINT_CACHE_SIZE', 128))
         # Sprite sheet animation assets
         self.sprite_frames = []  # list of pygame.Surface
+        self.sprite_frames_flipped = []  # left-facing copies of sprite_frames, built at load
+        self._sprite_prepared = {}  # (frame idx, facing, target_h) -> flipped + scaled frame
         self.sprite_loaded = False
         self.anim_time = 0.0
         self.facing = 1  # 1 right, -1 left
-        if getattr(config, 'PLAYER_SPRITES_ENABLED', False):
+        # Config values read every frame, resolved once here instead of per-frame getattr lookups
+        self._jump_dust_enabled = getattr(config, 'JUMP_DUST_ENABLED', False)
+        self._dust_gravity = getattr(config, 'GRAVITY', 1500) * 0.25
+        self._sprites_enabled = getattr(config, 'PLAYER_SPRITES_ENABLED', False)
+        self._anim_fps = getattr(config, 'PLAYER_ANIM_FPS', 10)
+        self._capsule_enabled = getattr(config, 'PLAYER_CAPSULE_ENABLED', True)
+        self._tint_enabled = getattr(config, 'PLAYER_TINT_ENABLED', False)
+        self._tint_steps = max(2, getattr(config, 'PLAYER_TINT_CACHE_STEPS', 64))
+        # Shadow is shared by the sprite and capsule paths, so bake it up front
+        self._shadow_cache = self._build_shadow()
+        if self._jump_dust_enabled:
+            self._bake_dust_discs()
+        if self._sprites_enabled:
             self._load_spritesheet()
 
     @property
@@ -38,15 +99,15 @@ class Player:
     def handle_input(self):
         keys = pygame.key.get_pressed()
         move = 0
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+        if keys[Player._K_LEFT] or keys[Player._K_A]:
             move -= 1
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+        if keys[Player._K_RIGHT] or keys[Player._K_D]:
             move += 1
         self.vx = move * config.PLAYER_MOVE_SPEED
-        if (keys[pygame.K_SPACE] or keys[pygame.K_UP] or keys[pygame.K_w]) and self.on_ground:
+        if (keys[Player._K_SPACE] or keys[Player._K_UP] or keys[Player._K_W]) and self.on_ground:
             self.vy = config.PLAYER_JUMP_VELOCITY
             self.on_ground = False
-            if getattr(config, 'JUMP_DUST_ENABLED', False):
+            if self._jump_dust_enabled:
                 self._spawn_dust_burst()
 
     def physics(self, dt: float):
@@ -55,8 +116,14 @@ class Player:
         # Integrate
         self.x += self.vx * dt
         self.y += self.vy * dt
-        # Ground collision using terrain height at player's x
-        ground_y = self.terrain.sample_height(self.x)
+        # Ground collision using terrain height at player's x (x is unchanged while idle
+        # on the ground, so the previous sample is still exact)
+        if self.on_ground and self.vx == 0.0 and self.x == self._last_sample_x:
+            ground_y = self._last_ground_y
+        else:
+            ground_y = self.terrain.sample_height(self.x)
+            self._last_sample_x = self.x
+            self._last_ground_y = ground_y
         if self.y > ground_y:
             self.y = ground_y
             self.vy = 0.0
@@ -69,11 +136,10 @@ class Player:
         self.physics(dt)
         self._update_particles(dt)
         self._was_on_ground = self.on_ground
-        # Track facing based on last non-zero vx
-        if self.vx < -1e-3:
-            self.facing = -1
-        elif self.vx > 1e-3:
-            self.facing = 1
+        # Track facing based on last non-zero vx (sign is 0 inside the dead zone)
+        sign = (self.vx > 1e-3) - (self.vx < -1e-3)
+        if sign:
+            self.facing = sign
         # Advance animation clock if sprites active
         if self.sprite_loaded:
             self.anim_time += dt
@@ -101,6 +167,7 @@ class Player:
                 data = json.load(f)
             sheet_image = pygame.image.load(sheet_path).convert_alpha()
             frames_dict = data.get('frames', {})
+            target_h = int(self.height)
             # Sort frame names to establish deterministic order (e.g., RunRight01, 02, ...)
             for name in sorted(frames_dict.keys()):
                 frame_info = frames_dict[name]
@@ -111,69 +178,82 @@ class Player:
                 h = fr.get('h', 0)
                 if w <= 0 or h <= 0:
                     continue
-                sub = pygame.Surface((w, h), pygame.SRCALPHA)
-                sub.blit(sheet_image, (0,0), pygame.Rect(x, y, w, h))
+                rect = pygame.Rect(x, y, w, h)
+                if sheet_image.get_rect().contains(rect):
+                    # Copy straight out of the sheet; it is already in the display's alpha format
+                    sub = sheet_image.subsurface(rect).copy()
+                else:
+                    # Rect overhangs the sheet: keep the transparent padding of a clipped blit
+                    sub = pygame.Surface((w, h), pygame.SRCALPHA).convert_alpha()
+                    sub.fill((0, 0, 0, 0))
+                    sub.blit(sheet_image, (0,0), rect)
+                # Scale once to the configured player height (aspect preserved)
+                if h != target_h:
+                    sub = pygame.transform.smoothscale(sub, (max(1, int(w * target_h / h)), target_h)).convert_alpha()
                 self.sprite_frames.append(sub)
             if self.sprite_frames:
+                self.sprite_frames_flipped = [pygame.transform.flip(f, True, False) for f in self.sprite_frames]
                 self.sprite_loaded = True
+                # Pre-warm both facings at the configured height so the first frames don't stall
+                for idx in range(len(self.sprite_frames)):
+                    for facing in (1, -1):
+                        self._prepared_frame(idx, facing, int(self.height))
         except Exception:
             # Silently fail; fallback to capsule
             self.sprite_frames = []
+            self.sprite_frames_flipped = []
             self.sprite_loaded = False
 
     # Particle system helpers
     def _spawn_dust_burst(self):
-        import random
-        rng = random.Random()
+        rng = _RNG
         count = getattr(config, 'DUST_PARTICLE_COUNT', 8)
         size_min, size_max = getattr(config, 'DUST_PARTICLE_SIZE_RANGE', (4, 10))
         life = getattr(config, 'DUST_PARTICLE_LIFETIME', 0.5)
-        base_col = getattr(config, 'DUST_PARTICLE_COLOR', (230, 225, 215))
-        for _ in range(count):
-            ang = rng.uniform(-math.pi * 0.9, -math.pi * 0.1)
-            speed = rng.uniform(60, 180)
-            vx = math.cos(ang) * speed
-            vy = math.sin(ang) * speed * 0.6
-            size = rng.uniform(size_min, size_max)
-            self.particles.append({
-                'x': self.x + rng.uniform(-self.width * 0.3, self.width * 0.3),
-                'y': self.y - 4,
-                'vx': vx,
-                'vy': vy,
-                'life': life,
-                'age': 0.0,
-                'size': size,
-                'color': base_col,
-            })
+        n = self._n_particles
+        # Buffer is bounded: a burst that doesn't fit is truncated rather than reallocating
+        count = min(count, self._particles.shape[1] - n)
+        if count <= 0:
+            return
+        # Sample the whole burst in one batch per attribute and write it as one slice
+        ang = rng.uniform(-math.pi * 0.9, -math.pi * 0.1, count)
+        speed = rng.uniform(60, 180, count)
+        burst = self._particles[:, n:n + count]
+        burst[_PX] = self.x + rng.uniform(-self.width * 0.3, self.width * 0.3, count)
+        burst[_PY] = self.y - 4
+        burst[_PVX] = np.cos(ang) * speed
+        burst[_PVY] = np.sin(ang) * speed * 0.6
+        burst[_PAGE] = 0.0
+        burst[_PLIFE] = life
+        burst[_PSIZE] = rng.uniform(size_min, size_max, count)
+        self._n_particles = n + count
 
     def _update_particles(self, dt: float):
-        if not self.particles:
+        n = self._n_particles
+        if not n:
             return
-        gravity = getattr(config, 'GRAVITY', 1500) * 0.25
-        for p in self.particles:
-            p['age'] += dt
-            t = p['age'] / p['life'] if p['life'] > 0 else 1
-            p['x'] += p['vx'] * dt
-            p['y'] += p['vy'] * dt
-            p['vy'] += gravity * dt * 0.2  # light gravity
-            # Slight horizontal drag
-            p['vx'] *= (1 - 1.4 * dt)
-            # Expand slightly
-            p['size'] *= (1 + 0.4 * dt)
-        # Cull dead
-        self.particles = [p for p in self.particles if p['age'] < p['life']]
+        # Without Numba the kernel runs as plain Python: still in place, no per-frame arrays,
+        # and the same stable compaction (draw order) as the compiled path
+        self._n_particles = _step_particles(self._particles, n, float(dt), float(self._dust_gravity))
+
+    def draw(self, surface: pygame.Surface, camera_x: float, day_t: float | None = None, y_offset: int = 0) -> pygame.Rect:
+        """Draw shadow, body and dust; returns the area touched this frame and last frame.
 
-    def draw(self, surface: pygame.Surface, camera_x: float, day_t: float | None = None):
+        The returned rect is suitable for ``pygame.display.update`` when the rest of the
+        screen is unchanged.
+        """
+        rects = []
+        batch = []  # everything is blitted in one blits() call at the end, in this order
         screen_x = self.x - camera_x - self.width / 2
-        screen_y = self.y - self.height
+        screen_y = self.y - self.height + y_offset
         # Prefer sprite rendering if enabled & loaded
-        if self.sprite_loaded and getattr(config, 'PLAYER_SPRITES_ENABLED', False):
+        if self.sprite_loaded and self._sprites_enabled:
             # Determine animation state (simple: idle vs run). Later can add jump/fall.
             speed = abs(self.vx)
             run_thresh = config.PLAYER_MOVE_SPEED * 0.15
             if speed > run_thresh and self.on_ground:
                 # Run cycle
-                fps = getattr(config, 'PLAYER_ANIM_FPS', 10)
+                fps = self._anim_fps
                 frame_count = len(self.sprite_frames)
                 if frame_count > 0:
                     idx = int(self.anim_time * fps) % frame_count
@@ -182,75 +262,41 @@ class Player:
             else:
                 # Idle: pick first frame
                 idx = 0
-            frame = self.sprite_frames[idx]
-            draw_frame = frame
-            if self.facing < 0:
-                draw_frame = pygame.transform.flip(frame, True, False)
-            # Scale sprite to configured player dimensions (maintain aspect ratio based on height)
             target_h = int(self.height)
-            scale = target_h / draw_frame.get_height()
-            target_w = max(1, int(draw_frame.get_width() * scale))
-            if draw_frame.get_height() != target_h:
-                draw_frame = pygame.transform.smoothscale(draw_frame, (target_w, target_h))
-            # Shadow (reuse capsule logic if cache exists, else build lightweight ellipse)
-            if not self._shadow_cache:
-                alpha = getattr(config, 'PLAYER_SHADOW_ALPHA', 70)
-                shadow_w = int(self.width * 1.2)
-                shadow_h = int(self.height * 0.28)
-                shadow = pygame.Surface((shadow_w, shadow_h), pygame.SRCALPHA)
-                rw = shadow_w / 2
-                rh = shadow_h / 2
-                for yy in range(shadow_h):
-                    for xx in range(shadow_w):
-                        nx = (xx - rw) / rw
-                        ny = (yy - rh) / rh
-                        d = nx * nx + ny * ny
-                        if d <= 1.0:
-                            a = int(alpha * (1 - d) ** 1.5)
-                            shadow.set_at((xx, yy), (0,0,0,a))
-                self._shadow_cache = shadow
+            draw_frame = self._prepared_frame(idx, self.facing, target_h)
+            target_w = draw_frame.get_width()
             # Draw shadow first
             if self._shadow_cache:
                 shadow_x = self.x - camera_x - self._shadow_cache.get_width() / 2
-                shadow_y = self.y - self._shadow_cache.get_height() * 0.45
-                surface.blit(self._shadow_cache, (shadow_x, shadow_y))
+                shadow_y = self.y - self._shadow_cache.get_height() * 0.45 + y_offset
+                batch.append((self._shadow_cache, (shadow_x, shadow_y)))
             # Draw sprite frame
             sprite_x = self.x - camera_x - target_w / 2
-            sprite_y = self.y - target_h
+            sprite_y = self.y - target_h + y_offset
             # Apply optional day-night tint
-            if getattr(config, 'PLAYER_TINT_ENABLED', False) and day_t is not None:
-                draw_frame = self._apply_day_tint(draw_frame, day_t)
-            surface.blit(draw_frame, (int(sprite_x), int(sprite_y)))
-        elif getattr(config, 'PLAYER_CAPSULE_ENABLED', True):
+            if self._tint_enabled and day_t is not None:
+                draw_frame = self._tinted(draw_frame, ('sprite', idx, self.facing, target_h), day_t)
+            batch.append((draw_frame, (int(sprite_x), int(sprite_y))))
+        elif self._capsule_enabled:
             size_key = (self.width, self.height, config.COLOR_PLAYER)
             if size_key != self._last_size_key or self._body_cache is None:
                 self._last_size_key = size_key
                 w = int(self.width)
                 h = int(self.height)
                 body = pygame.Surface((w, h), pygame.SRCALPHA)
-                # Base skin tone (derive from config color but ensure warm tone)
-                base = config.COLOR_PLAYER
-                top_col = (min(255, int(base[0] * 1.1)), min(255, int(base[1] * 1.05)), min(255, int(base[2] * 0.95)))
-                bot_col = (int(base[0] * 0.75), int(base[1] * 0.7), int(base[2] * 0.65))
-                for yy in range(h):
-                    t = yy / (h - 1)
-                    r = int(top_col[0] * (1 - t) + bot_col[0] * t)
-                    g = int(top_col[1] * (1 - t) + bot_col[1] * t)
-                    b = int(top_col[2] * (1 - t) + bot_col[2] * t)
-                    pygame.draw.line(body, (r, g, b), (0, yy), (w, yy))
+                body.fill((0, 0, 0, 0))
                 radius = min(int(w / 2), int(h / 2))
-                # Mask corners to create capsule using alpha circle cuts
-                mask = pygame.Surface((w, h), pygame.SRCALPHA)
-                pygame.draw.rect(mask, (255, 255, 255, 255), (0, radius, w, h - 2 * radius))
-                pygame.draw.circle(mask, (255, 255, 255, 255), (radius, radius), radius)
-                pygame.draw.circle(mask, (255, 255, 255, 255), (w - radius, radius), radius)
-                pygame.draw.circle(mask, (255, 255, 255, 255), (radius, h - radius), radius)
-                pygame.draw.circle(mask, (255, 255, 255, 255), (w - radius, h - radius), radius)
-                body.blit(mask, (0,0), special_flags=pygame.BLEND_RGBA_MULT)
-                # Outline
-                outline = pygame.Surface((w, h), pygame.SRCALPHA)
-                pygame.draw.rect(outline, (0,0,0,130), (0,0,w,h), border_radius=radius)
-                body.blit(outline, (0,0), special_flags=pygame.BLEND_RGBA_MIN)
+                # Capsule silhouette in one pass: pixel centres within ``radius`` of the inner
+                # rectangle. This is what the old gradient + circle-mask MULT + rounded-rect MIN
+                # blits produced: the MIN against the (0, 0, 0, 130) outline zeroed the RGB, so
+                # only this alpha shape survived.
+                px = np.arange(w)[:, None] + 0.5
+                py = np.arange(h)[None, :] + 0.5
+                dx = px - np.clip(px, radius, w - radius)
+                dy = py - np.clip(py, radius, h - radius)
+                alpha = pygame.surfarray.pixels_alpha(body)
+                alpha[:] = np.where(np.hypot(dx, dy) <= radius - 0.25, 130, 0)  # (x, y) order
+                del alpha  # release surface lock
                 # Simple highlight ellipse near top-left
                 hl = pygame.Surface((w, h), pygame.SRCALPHA)
                 pygame.draw.ellipse(hl, (255,255,255,60), (w*0.25, h*0.15, w*0.5, h*0.35))
@@ -277,44 +323,110 @@ class Player:
                     mouth_rect = pygame.Rect(cx - mouth_w//2, mouth_y, mouth_w, eye_r*2)
                     pygame.draw.arc(face, mouth_col, mouth_rect, math.pi*0.1, math.pi*0.9, 2)
                     body.blit(face, (0,0))
+                # Match the display's pixel format so per-frame blits take the fast path
+                if pygame.display.get_surface() is not None:
+                    body = body.convert_alpha()
                 self._body_cache = body
                 # Shadow cache
-                alpha = getattr(config, 'PLAYER_SHADOW_ALPHA', 70)
-                shadow_w = int(self.width * 1.2)
-                shadow_h = int(self.height * 0.28)
-                shadow = pygame.Surface((shadow_w, shadow_h), pygame.SRCALPHA)
-                rw = shadow_w / 2
-                rh = shadow_h / 2
-                for yy in range(shadow_h):
-                    for xx in range(shadow_w):
-                        nx = (xx - rw) / rw
-                        ny = (yy - rh) / rh
-                        d = nx * nx + ny * ny
-                        if d <= 1.0:
-                            a = int(alpha * (1 - d) ** 1.5)
-                            shadow.set_at((xx, yy), (0,0,0,a))
-                self._shadow_cache = shadow
+                self._shadow_cache = self._build_shadow()
             frame_to_draw = self._body_cache
-            if getattr(config, 'PLAYER_TINT_ENABLED', False) and day_t is not None:
-                frame_to_draw = self._apply_day_tint(self._body_cache, day_t)
-            surface.blit(frame_to_draw, (int(screen_x), int(screen_y)))
+            if self._tint_enabled and day_t is not None:
+                frame_to_draw = self._tinted(self._body_cache, ('body', size_key), day_t)
+            batch.append((frame_to_draw, (int(screen_x), int(screen_y))))
             if self._shadow_cache:
                 shadow_x = self.x - camera_x - self._shadow_cache.get_width() / 2
-                shadow_y = self.y - self._shadow_cache.get_height() * 0.45
-                surface.blit(self._shadow_cache, (shadow_x, shadow_y))
+                shadow_y = self.y - self._shadow_cache.get_height() * 0.45 + y_offset
+                batch.append((self._shadow_cache, (shadow_x, shadow_y)))
         else:
-            pygame.draw.rect(surface, config.COLOR_PLAYER, pygame.Rect(screen_x, screen_y, self.width, self.height))
+            rects.append(pygame.draw.rect(surface, config.COLOR_PLAYER, pygame.Rect(screen_x, screen_y, self.width, self.height)))
         # Draw particles after player so they appear in front of shadow but behind future effects
-        if self.particles:
-            for p in self.particles:
-                t = p['age'] / p['life'] if p['life'] > 0 else 1
-                fade = max(0.0, 1 - t)
-                a = int(255 * (fade ** 1.5))
-                r, g, b = p['color']
-                size = max(1, int(p['size']))
-                surf = pygame.Surface((size, size), pygame.SRCALPHA)
-                pygame.draw.circle(surf, (r, g, b, a), (size // 2, size // 2), size // 2)
-                surface.blit(surf, (p['x'] - camera_x - size / 2, p['y'] - size / 2))
+        n = self._n_particles
+        if n:
+            px, py, _, _, age, life, psize = self._particles[:, :n]
+            t = np.where(life > 0, age / np.where(life > 0, life, 1.0), 1.0)
+            alphas = (255 * np.maximum(0.0, 1 - t) ** 1.5).astype(np.int32).tolist()
+            sizes = np.maximum(1, psize.astype(np.int32))
+            xs = (px - camera_x - sizes / 2).tolist()
+            ys = (py - sizes / 2 + y_offset).tolist()
+            color = self._dust_color
+            blend = pygame.BLEND_PREMULTIPLIED
+            batch += [(self._dust_surface(size, a, color), (x, y), None, blend) for size, a, x, y in zip(sizes.tolist(), alphas, xs, ys)]
+        # One C-level call for shadow, body and dust (pygame 2.x has no fblits); the
+        # returned rects feed the dirty-rect union
+        if batch:
+            rects += surface.blits(batch)
+        # Update shape is the union of this frame's and last frame's bounds
+        curr = rects[0].unionall(rects[1:]) if rects else pygame.Rect(int(screen_x), int(screen_y), 0, 0)
+        dirty = curr.union(self._prev_rect) if self._prev_rect is not None else curr
+        self._prev_rect = curr
+        return dirty
+
+    def _build_shadow(self) -> pygame.Surface:
+        """Bake the soft elliptical ground shadow (alpha falls off as (1 - d)^1.5)."""
+        alpha = getattr(config, 'PLAYER_SHADOW_ALPHA', 70)
+        shadow_w = int(self.width * 1.2)
+        shadow_h = int(self.height * 0.28)
+        shadow = pygame.Surface((shadow_w, shadow_h), pygame.SRCALPHA)
+        shadow.fill((0, 0, 0, 0))
+        rw = shadow_w / 2
+        rh = shadow_h / 2
+        nx = (np.arange(shadow_w) - rw) / rw
+        ny = (np.arange(shadow_h) - rh) / rh
+        d = nx[:, None] ** 2 + ny[None, :] ** 2  # (x, y) to match surfarray
+        a = np.where(d <= 1.0, alpha * np.clip(1 - d, 0.0, None) ** 1.5, 0.0).astype(np.uint8)
+        pixels = pygame.surfarray.pixels_alpha(shadow)
+        pixels[:] = a
+        del pixels  # release surface lock
+        if pygame.display.get_surface() is not None:
+            shadow = shadow.convert_alpha()
+        return shadow
+
+    def _bake_dust_discs(self):
+        """Pre-bake every disc a dust burst can ask for so drawing never allocates."""
+        size_min, size_max = getattr(config, 'DUST_PARTICLE_SIZE_RANGE', (4, 10))
+        life = getattr(config, 'DUST_PARTICLE_LIFETIME', 0.5)
+        # Particles grow by (1 + 0.4*dt) per step, bounded by exp(0.4 * life) over a lifetime
+        largest = int(size_max * math.exp(0.4 * life)) + 1
+        for size in range(max(1, int(size_min)), largest + 1):
+            for level in range(16):
+                self._dust_surface(size, level << 4, self._dust_color)
+
+    def _dust_surface(self, size: int, alpha: int, color) -> pygame.Surface:
+        """Return a cached particle disc with premultiplied colour; alpha is quantized to 16 levels.
+
+        Draw it with ``BLEND_PREMULTIPLIED``.
+        """
+        level = alpha >> 4
+        key = (size, level, color)
+        surf = self._dust_lut.get(key)
+        if surf is None:
+            a = level * 17
+            surf = pygame.Surface((size, size), pygame.SRCALPHA)
+            premul = (color[0] * a // 255, color[1] * a // 255, color[2] * a // 255, a)
+            pygame.draw.circle(surf, premul, (size // 2, size // 2), size // 2)
+            self._dust_lut[key] = surf
+        return surf
+
+    def _prepared_frame(self, idx: int, facing: int, target_h: int) -> pygame.Surface:
+        """Sprite frame ``idx`` flipped for ``facing`` and scaled to ``target_h`` (cached)."""
+        key = (idx, facing, target_h)
+        surf = self._sprite_prepared.get(key)
+        if surf is None:
+            surf = (self.sprite_frames_flipped if facing < 0 else self.sprite_frames)[idx]
+            # Frames are pre-scaled to the configured height at load; only rescale if it changed
+            if surf.get_height() != target_h:
+                target_w = max(1, int(surf.get_width() * target_h / surf.get_height()))
+                surf = pygame.transform.smoothscale(surf, (target_w, target_h))
+            if pygame.display.get_surface() is not None:
+                surf = surf.convert_alpha()
+            self._sprite_prepared[key] = surf
+        return surf
+
+    def _tinted(self, frame: pygame.Surface, frame_key, day_t: float) -> pygame.Surface:
+        """Cached :meth:`_apply_day_tint`; ``frame_key`` must identify ``frame``'s content."""
+        steps = self._tint_steps
+        bucket = int(day_t * (steps - 1))
+        return self._tint_cache.get_or_build((frame_key, bucket), lambda: self._apply_day_tint(frame, bucket / (steps - 1)))
 
     def _apply_day_tint(self, frame: pygame.Surface, day_t: float) -> pygame.Surface:
         """Return a tinted copy of the frame according to day-night cycle.
@@ -352,8 +464,6 @@ class Player:
         g_mul = target[1] / 255.0
         b_mul = target[2] / 255.0
         tinted = frame.copy()
-        # Fast per-pixel multiply via BLEND_RGBA_MULT using a solid surface
-        mul = pygame.Surface(frame.get_size(), pygame.SRCALPHA)
-        mul.fill((int(255 * r_mul), int(255 * g_mul), int(255 * b_mul), 255))
-        tinted.blit(mul, (0,0), special_flags=pygame.BLEND_RGBA_MULT)
+        # Per-pixel multiply in place; a blend-flagged fill needs no solid scratch surface
+        tinted.fill((int(255 * r_mul), int(255 * g_mul), int(255 * b_mul), 255), special_flags=pygame.BLEND_RGBA_MULT)
         return tinted
@@ -1,26 +1,134 @@
 from __future__ import annotations
 import math
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Dict, List, Tuple
+import numpy as np
 import pygame
 
 from . import config
+from .cache import LRUCache
+from .jit import njit, NUMBA_AVAILABLE
 from .noise import Noise1D  # use class directly
 
 Point = Tuple[float, float]
 
+
+@njit(cache=True, fastmath=True)
+def _catmull_rom_kernel(xs, ys, weights, min_points, max_dy, max_slope, clamp, passes, threshold, relax):
+    # Fused segmentation + Catmull-Rom + vertical clamp + spike filter; same steps as the
+    # NumPy path in TerrainManager._catmull_rom. Returns (out_x, out_y, count); count == 0
+    # means no segment survived and the caller keeps the raw ridge.
+    n = xs.shape[0]
+    subdivs = weights.shape[0]
+    out_x = np.empty(n * subdivs + 1)
+    out_y = np.empty(n * subdivs + 1)
+    m = 0
+    a = 0
+    for b in range(1, n + 1):
+        if b < n:
+            dy = abs(ys[b] - ys[b - 1])
+            if not (dy > max_dy or dy / max(1e-6, xs[b] - xs[b - 1]) > max_slope):
+                continue
+        if b - a >= min_points:
+            for j in range(a, b - 1):
+                i0 = max(j - 1, a)
+                i3 = min(j + 2, b - 1)
+                for s in range(subdivs):
+                    out_x[m] = weights[s, 0] * xs[i0] + weights[s, 1] * xs[j] + weights[s, 2] * xs[j + 1] + weights[s, 3] * xs[i3]
+                    out_y[m] = weights[s, 0] * ys[i0] + weights[s, 1] * ys[j] + weights[s, 2] * ys[j + 1] + weights[s, 3] * ys[i3]
+                    m += 1
+            out_x[m] = xs[b - 1]
+            out_y[m] = ys[b - 1]
+            m += 1
+        elif b - a >= 2:
+            for i in range(a, b):
+                out_x[m] = xs[i]
+                out_y[m] = ys[i]
+                m += 1
+        a = b
+    if m == 0:
+        return out_x, out_y, 0
+    if clamp > 0:
+        band_min = ys.min() - clamp
+        band_max = ys.max() + clamp
+        for i in range(m):
+            out_y[i] = min(max(out_y[i], band_min), band_max)
+    # Spike filter reads the previous pass and writes a second buffer, then swaps
+    buf = out_y[:m].copy()
+    for _ in range(passes):
+        changed = False
+        for i in range(2, m - 2):
+            y_prev = (out_y[i - 1] + out_y[i - 2]) * 0.5
+            y_next = (out_y[i + 1] + out_y[i + 2]) * 0.5
+            diff = out_y[i] - 0.5 * (y_prev + y_next)
+            if diff < -threshold:
+                buf[i] = out_y[i] - diff * relax
+                changed = True
+            else:
+                buf[i] = out_y[i]
+        if not changed:
+            break
+        for i in range(2, m - 2):
+            out_y[i] = buf[i]
+    return out_x, out_y, m
+
 class TerrainManager:
     """Generates and caches terrain chunks.
 
-    Each chunk spans CHUNK_WIDTH pixels and stores sampled points spaced by POINT_SPACING.
-    To reduce visible seams at chunk boundaries we 'peek' one point beyond the boundary,
-    then when the adjacent chunk is generated we blend a small overlap region so the slope
-    transitions smoothly.
+    Each chunk spans CHUNK_WIDTH pixels and stores sampled points spaced by POINT_SPACING
+    as two parallel arrays ``(xs, ys)`` (float64 xs, float32 heights).
+    Adjacent chunks share their boundary sample: the right chunk reuses the left chunk's
+    last height instead of resampling it. To reduce visible seams, when the adjacent chunk
+    is generated we blend a small overlap region so the slope transitions smoothly.
     """
     def __init__(self, seed: int = config.SEED):
         self.seed = seed  # store local seed
         self.noise = Noise1D(seed=seed)  # dedicated noise instance
-        self.chunks: Dict[int, List[Point]] = {}
+        self._highlight_noise = Noise1D(seed=seed + 777)  # modulates ridge highlight alpha
+        self.chunk_biome: Dict[int, int] = {}  # chunk idx -> index into BIOME_COLOR_VARIANTS
+        # Background noise sampling for chunks ahead of the camera (ASYNC_TERRAIN_THREAD).
+        # Workers only compute raw samples; results land in _chunk_cache on the main thread,
+        # and chunks are still installed (and blended) in order by ensure_chunks.
+        self._pool: ThreadPoolExecutor | None = None
+        self._pending: Dict[int, Future] = {}
+        self._async_failed: set = set()  # chunks whose worker raised; generated synchronously instead
+        self.chunks: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+        # Raw (pre-blend) noise samples per chunk; outlives pruning so revisited chunks skip sampling
+        self._chunk_cache = LRUCache(getattr(config, 'TERRAIN_CHUNK_CACHE_SIZE',
+                                             config.PREFETCH_CHUNKS_AHEAD + config.PREFETCH_CHUNKS_BEHIND + 8))
         self.overlap = config.POINT_SPACING * 2  # pixels to blend at boundaries
+        # (visible chunk indices, xs, ys) of the last concatenated + smoothed ridge; chunks are
+        # never modified once generated, so the indices alone identify the content
+        self._visible_ridge_cache: Tuple[Tuple[int, ...], np.ndarray, np.ndarray] | None = None
+        self._cr_weights: Dict[int, np.ndarray] = {}  # subdivs -> Catmull-Rom weight matrix
+        # Reused highlight/shadow layer; kept transparent outside the rect drawn last frame
+        self._edge_surf: pygame.Surface | None = None
+        self._edge_dirty: pygame.Rect | None = None
+        # Reused (n, 2) screen-space polygon scratch; grown geometrically when the ridge outgrows it
+        self._poly_buf = np.empty((0, 2))
+        # Config values read every frame, resolved once here instead of per-frame getattr lookups
+        self._biome_colors = getattr(config, 'BIOME_COLOR_VARIANTS', [config.COLOR_TERRAIN])
+        self._day_col = getattr(config, 'TERRAIN_DAY_COLOR', None)  # None -> biome base colour
+        self._night_col = getattr(config, 'TERRAIN_NIGHT_COLOR', None)
+        self._highlight_col = getattr(config, 'RIDGE_HIGHLIGHT_COLOR', (255, 255, 255))
+        self._hl_alpha = getattr(config, 'RIDGE_HIGHLIGHT_ALPHA', 120)
+        self._shadow_alpha = getattr(config, 'RIDGE_SHADOW_ALPHA', 60)
+        self._shadow_atten = getattr(config, 'RIDGE_SHADOW_SLOPE_ATTEN', 0.0)
+        self._hl_noise_enabled = getattr(config, 'HIGHLIGHT_NOISE_ENABLED', False)
+        self._hl_noise_scale = getattr(config, 'HIGHLIGHT_NOISE_SCALE', 0.0015)
+        self._hl_noise_amp = getattr(config, 'HIGHLIGHT_NOISE_AMPLITUDE', 0.35)
+        self._slope_lighting = getattr(config, 'SLOPE_LIGHTING_ENABLED', False)
+        self._sun_bias = getattr(config, 'SUN_NORMAL_BIAS', 0.3)
+        self._sun_strength = getattr(config, 'SUN_HIGHLIGHT_STRENGTH', 1.0)
+        self._edge_alpha_step = max(1, getattr(config, 'TERRAIN_EDGE_ALPHA_STEP', 4))
+        # Sun direction for slope lighting: straight up, or with a slight forward bias so
+        # slopes facing up-left get a bit more light
+        sun_dir_x, sun_dir_y = (-0.3, -1.0) if self._slope_lighting else (0.0, -1.0)
+        length = math.hypot(sun_dir_x, sun_dir_y)
+        self._sun_dir = (sun_dir_x / length, sun_dir_y / length)
+        # Ridge shadow alpha by slope quantized to 1/64; attenuation saturates at slope 4
+        slopes = np.arange(257) / 64
+        self._shadow_lut = (self._shadow_alpha * (1.0 - np.minimum(1.0, slopes * 0.25) * self._shadow_atten)).astype(np.int64)
 
     def world_x_range_for_chunk(self, chunk_idx: int) -> Tuple[int, int]:
         start_x = chunk_idx * config.CHUNK_WIDTH
@@ -32,65 +140,123 @@ class TerrainManager:
         n = self.noise.fractal(x * config.NOISE_SCALE, octaves=config.NOISE_OCTAVES)
         return config.BASELINE - n * config.NOISE_AMPLITUDE
 
+    def _sample_heights(self, xs: np.ndarray, parallel: bool = True) -> np.ndarray:
+        # Batched _sample_height over a whole chunk's sample positions. Heights are stored as
+        # float32 (plenty for screen-space y); xs stay float64 so far-away x remains exact.
+        n = self.noise.fractal_array(xs * config.NOISE_SCALE, octaves=config.NOISE_OCTAVES, parallel=parallel)
+        return (config.BASELINE - n * config.NOISE_AMPLITUDE).astype(np.float32)
+
+    def _chunk_xs(self, chunk_idx: int) -> np.ndarray:
+        start_x, end_x = self.world_x_range_for_chunk(chunk_idx)
+        # Include one extra sample beyond end for smoothing with next chunk
+        return np.arange(start_x, end_x + config.POINT_SPACING, config.POINT_SPACING, dtype=np.float64)
+
+    def _sample_chunk_async(self, chunk_idx: int) -> Tuple[np.ndarray, np.ndarray]:
+        # Runs on a worker thread; touches no shared mutable state
+        sx = self._chunk_xs(chunk_idx)
+        return sx, self._sample_heights(sx, parallel=False)
+
+    def _collect_async(self) -> None:
+        """Move finished background samples into the raw-sample cache."""
+        for idx, fut in list(self._pending.items()):
+            if fut.done():
+                del self._pending[idx]
+                if fut.exception() is None:
+                    self._chunk_cache.store(idx, fut.result())
+                else:
+                    # Don't requeue it; ensure_chunks samples it on the main thread, where
+                    # a persistent error surfaces instead of stalling installs forever
+                    self._async_failed.add(idx)
+
+    def _prefetch_async(self, first: int, last: int) -> None:
+        """Queue background sampling for chunks in ``first..last`` that aren't available yet."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=max(1, getattr(config, 'TERRAIN_WORKERS', 2)),
+                                            thread_name_prefix='terrain')
+        for idx in range(first, last + 1):
+            if (not config.ALLOW_NEGATIVE_CHUNKS) and idx < 0:
+                continue
+            if idx in self.chunks or idx in self._pending or idx in self._chunk_cache or idx in self._async_failed:
+                continue
+            self._pending[idx] = self._pool.submit(self._sample_chunk_async, idx)
+
     def generate_chunk(self, chunk_idx: int) -> None:
         if (not config.ALLOW_NEGATIVE_CHUNKS) and chunk_idx < 0:
             return
         if chunk_idx in self.chunks:
             return
-        start_x, end_x = self.world_x_range_for_chunk(chunk_idx)
-        points: List[Point] = []
-
-        # Include one extra sample beyond end for smoothing with next chunk
-        for sx in range(start_x, end_x + config.POINT_SPACING, config.POINT_SPACING):
-            y = self._sample_height(sx)
-            points.append((float(sx), y))
-
-        self.chunks[chunk_idx] = points
+        raw = self._chunk_cache.lookup(chunk_idx)
+        if raw is None:
+            sx = self._chunk_xs(chunk_idx)
+            left = self._chunk_cache.get(chunk_idx - 1)  # peek; don't refresh its LRU slot
+            if left is not None and left[0][-1] == sx[0]:
+                # Adjacent chunks share an endpoint; reuse its height instead of resampling
+                ys = np.empty(len(sx), dtype=np.float32)
+                ys[0] = left[1][-1]
+                ys[1:] = self._sample_heights(sx[1:])
+            else:
+                ys = self._sample_heights(sx)
+            raw = self._chunk_cache.store(chunk_idx, (sx, ys))
+        sx, ys = raw
+        self._async_failed.discard(chunk_idx)
+        # Blending writes ys in place, so the cached samples stay pristine
+        self.chunks[chunk_idx] = (sx, ys.copy())
+        self.chunk_biome[chunk_idx] = self._biome_index(chunk_idx)
 
         # If previous exists, blend overlap region between previous tail and this head
         prev_idx = chunk_idx - 1
         if prev_idx in self.chunks:
             self._blend_boundary(prev_idx, chunk_idx)
 
+    def _biome_index(self, chunk_idx: int) -> int:
+        # Biome band containing the chunk's centre
+        band_w = getattr(config, 'BIOME_BAND_WIDTH', config.CHUNK_WIDTH * 8)
+        variants = len(getattr(config, 'BIOME_COLOR_VARIANTS', [config.COLOR_TERRAIN])) or 1
+        start_x, _ = self.world_x_range_for_chunk(chunk_idx)
+        return int((start_x + config.CHUNK_WIDTH / 2) // band_w) % variants
+
     def _blend_boundary(self, left_idx: int, right_idx: int) -> None:
-        left_points = self.chunks[left_idx]
-        right_points = self.chunks[right_idx]
+        left_xs, left_ys = self.chunks[left_idx]
+        right_xs, right_ys = self.chunks[right_idx]
         # Determine overlapping x range to blend
-        blend_start = left_points[-1][0] - self.overlap
-        blend_end = left_points[-1][0]
-        # Build mapping for right points for quick replacement
-        rp_index = {p[0]: i for i, p in enumerate(right_points)}
-        # Gather points in left chunk in blend zone (excluding final duplicate maybe)
-        left_zone = [p for p in left_points if blend_start <= p[0] <= blend_end]
-        if not left_zone:
+        blend_end = float(left_xs[-1])
+        blend_start = blend_end - self.overlap
+        # Bail out if the left chunk has no samples in the blend zone
+        if not ((left_xs >= blend_start) & (left_xs <= blend_end)).any():
             return
         # Compute slope at boundary using last two left points
-        if len(left_points) >= 2:
-            (x1, y1), (x2, y2) = left_points[-2], left_points[-1]
+        if len(left_xs) >= 2:
+            x1, x2 = float(left_xs[-2]), float(left_xs[-1])
+            y1, y2 = float(left_ys[-2]), float(left_ys[-1])
             boundary_slope = (y2 - y1) / (x2 - x1) if x2 != x1 else 0.0
         else:
             boundary_slope = 0.0
-        # Adjust the first few right points so first derivative feels continuous
-        for p in right_points:
-            x = p[0]
-            if x > blend_end + self.overlap:
-                break
-            if x in rp_index and x <= blend_end + self.overlap:
-                t = (x - (blend_end)) / (self.overlap + config.POINT_SPACING)
-                t = max(0.0, min(1.0, t))
-                # predicted y continuing slope from boundary
-                predicted = left_points[-1][1] + boundary_slope * (x - left_points[-1][0])
-                # current procedural y (original)
-                original = p[1]
-                blended_y = predicted * (1 - t) + original * t
-                right_points[rp_index[x]] = (x, blended_y)
+        # Adjust the first few right points so first derivative feels continuous. The blend
+        # zone is the prefix up to blend_end + overlap: a fixed count of samples when the
+        # right chunk starts on the shared endpoint, otherwise found by search
+        if right_xs[0] == blend_end:
+            k = min(len(right_xs), int(self.overlap // config.POINT_SPACING) + 1)
+        else:
+            k = int(np.searchsorted(right_xs, blend_end + self.overlap, side='right'))
+        x = right_xs[:k]
+        t = np.clip((x - blend_end) / (self.overlap + config.POINT_SPACING), 0.0, 1.0)
+        # predicted y continuing slope from boundary, blended toward the procedural y
+        predicted = float(left_ys[-1]) + boundary_slope * (x - blend_end)
+        right_ys[:k] = predicted * (1 - t) + right_ys[:k] * t
 
     def ensure_chunks(self, camera_x: float, screen_width: int) -> None:
         # Prefetch based on configurable window so terrain appears instantly when revealed
         current_idx = int(math.floor(camera_x / config.CHUNK_WIDTH))
         left_keep = current_idx - config.PREFETCH_CHUNKS_BEHIND
         right_target = current_idx + config.PREFETCH_CHUNKS_AHEAD
-        # Cap chunk generations per frame to avoid frame spikes
+        # Last chunk draw() can show (it crops the ridge to camera_x + screen_width + 50)
+        visible_last = int(math.floor((camera_x + screen_width + 50) / config.CHUNK_WIDTH))
+        if getattr(config, 'ASYNC_TERRAIN_THREAD', False):
+            self._collect_async()
+            # Everything on screen stays synchronous so it is never late
+            self._prefetch_async(visible_last + 1, right_target)
+        # Cap chunk generations per frame to avoid frame spikes; chunks whose samples are
+        # already cached only need copying + blending and don't count against the budget
         budget = config.MAX_CHUNKS_PER_FRAME
         # Iterate forward first (player typically moves right)
         for idx in range(current_idx - 1, right_target + 1):
@@ -99,8 +265,11 @@ class TerrainManager:
             if (not config.ALLOW_NEGATIVE_CHUNKS) and idx < 0:
                 continue
             if idx not in self.chunks:
+                if idx in self._pending and idx > visible_last:
+                    break  # keep chunks installed in order; this one is still being sampled
+                cold = idx not in self._chunk_cache
                 self.generate_chunk(idx)
-                budget -= 1
+                budget -= cold
         # Then ensure minimal behind chunks
         if budget > 0:
             for idx in range(current_idx - 2, left_keep - 1, -1):
@@ -115,141 +284,169 @@ class TerrainManager:
         prune = [ci for ci in self.chunks.keys() if ci < left_keep]
         for ci in prune:
             del self.chunks[ci]
+            self.chunk_biome.pop(ci, None)
 
     def sample_height(self, x: float) -> float:
         # Find chunk
         chunk_idx = int(math.floor(x / config.CHUNK_WIDTH))
         if chunk_idx not in self.chunks:
             self.generate_chunk(chunk_idx)
-        points = self.chunks[chunk_idx]
-        # Binary search or linear walk (few points so linear is fine)
-        for i in range(len(points) - 1):
-            x0, y0 = points[i]
-            x1, y1 = points[i + 1]
-            if x0 <= x <= x1:
-                t = (x - x0) / (x1 - x0) if x1 != x0 else 0.0
-                return y0 + (y1 - y0) * t
-        return points[-1][1]
+        xs, ys = self.chunks[chunk_idx]
+        # Samples are uniformly spaced from the chunk start, so the segment index is O(1)
+        i = int((x - chunk_idx * config.CHUNK_WIDTH) // config.POINT_SPACING)
+        if i < 0 or i >= len(xs) - 1:
+            # Outside the sampled span (only possible if CHUNK_WIDTH isn't a multiple of POINT_SPACING)
+            i = int(np.searchsorted(xs, x, side='right')) - 1
+            if i < 0 or i >= len(xs) - 1:
+                return float(ys[-1]) if x >= xs[-1] else float(ys[0])
+        x0, x1 = float(xs[i]), float(xs[i + 1])
+        y0, y1 = float(ys[i]), float(ys[i + 1])
+        t = (x - x0) / (x1 - x0) if x1 != x0 else 0.0
+        return y0 + (y1 - y0) * t
+
+    def _visible_ridge(self, left_bound: float, right_bound: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Ridge points with ``left_bound <= x <= right_bound``, sorted by x (smoothed if enabled).
+
+        Chunks are concatenated in index order (each chunk's xs is sorted and chunks tile
+        the x axis), so no sort is needed. The concatenated ridge is smoothed once and
+        reused until the set of visible chunks changes; per frame only the crop moves.
+        """
+        cw = config.CHUNK_WIDTH
+        # Start one chunk early: its extra trailing sample can land exactly on left_bound
+        first = int(math.floor(left_bound / cw)) - 1
+        last = int(math.floor(right_bound / cw))
+        key = tuple(i for i in range(first, last + 1) if i in self.chunks)
+        cached = self._visible_ridge_cache
+        if cached is None or cached[0] != key:
+            if key:
+                xs = np.concatenate([self.chunks[i][0] for i in key])
+                ys = np.concatenate([self.chunks[i][1] for i in key])
+                if config.TERRAIN_SMOOTHING_ENABLED:
+                    xs, ys = self._catmull_rom(xs, ys, config.TERRAIN_SMOOTH_SUBDIVS)
+            else:
+                xs = ys = np.empty(0)
+            cached = self._visible_ridge_cache = (key, xs, ys)
+        _, xs, ys = cached
+        lo = int(np.searchsorted(xs, left_bound, side='left'))
+        hi = int(np.searchsorted(xs, right_bound, side='right'))
+        return xs[lo:hi], ys[lo:hi]
 
-    def _catmull_rom(self, pts: List[Point], subdivs: int) -> List[Point]:
-        if len(pts) < config.TERRAIN_SMOOTH_MIN_POINTS or subdivs <= 1:
-            return pts
+    # Catmull-Rom basis: row k holds the coefficients of t^k over (p0, p1, p2, p3)
+    _CR_MATRIX = np.array([[0.0, 2.0, 0.0, 0.0],
+                           [-1.0, 0.0, 1.0, 0.0],
+                           [2.0, -5.0, 4.0, -1.0],
+                           [-1.0, 3.0, -3.0, 1.0]])
+
+    def _catmull_rom_weights(self, subdivs: int) -> np.ndarray:
+        """(subdivs, 4) control-point weights for t = s / subdivs (cached per subdivs)."""
+        weights = self._cr_weights.get(subdivs)
+        if weights is None:
+            t = np.arange(subdivs) / subdivs
+            powers = np.stack([np.ones_like(t), t, t * t, t * t * t], axis=1)
+            weights = self._cr_weights[subdivs] = 0.5 * powers @ TerrainManager._CR_MATRIX
+        return weights
+
+    def _catmull_rom(self, xs: np.ndarray, ys: np.ndarray, subdivs: int) -> Tuple[np.ndarray, np.ndarray]:
+        if len(xs) < config.TERRAIN_SMOOTH_MIN_POINTS or subdivs <= 1:
+            return xs, ys
         # Break the ridge into segments where slope or vertical delta is extreme to avoid huge spikes
         max_dy = config.NOISE_AMPLITUDE * 1.2  # treat anything larger than this between raw samples as a boundary
         max_slope = max_dy / config.POINT_SPACING * 0.8
-        segments: List[List[Point]] = []
-        cur: List[Point] = [pts[0]]
-        for i in range(1, len(pts)):
-            x0, y0 = pts[i - 1]
-            x1, y1 = pts[i]
-            dy = abs(y1 - y0)
-            slope = dy / max(1e-6, (x1 - x0))
-            if dy > max_dy or slope > max_slope:
-                # start new segment, push current
-                if len(cur) >= 2:
-                    segments.append(cur)
-                cur = [pts[i]]
-            else:
-                cur.append(pts[i])
-        if len(cur) >= 2:
-            segments.append(cur)
+        weights = self._catmull_rom_weights(subdivs)
+        spike = getattr(config, 'SPIKE_FILTER_ENABLED', False)
+        threshold = getattr(config, 'SPIKE_FILTER_THRESHOLD', 18.0)
+        relax = getattr(config, 'SPIKE_RELAX_FACTOR', 0.5)
+        passes = getattr(config, 'SPIKE_FILTER_PASSES', 1) if spike else 0
+        if NUMBA_AVAILABLE:
+            out_x, out_y, m = _catmull_rom_kernel(
+                np.ascontiguousarray(xs, dtype=np.float64), np.ascontiguousarray(ys, dtype=np.float64),
+                weights, int(config.TERRAIN_SMOOTH_MIN_POINTS), float(max_dy), float(max_slope),
+                float(config.TERRAIN_SMOOTH_VERTICAL_CLAMP or 0), int(passes), float(threshold), float(relax))
+            return (out_x[:m], out_y[:m]) if m else (xs, ys)
+        dy = np.abs(np.diff(ys))
+        slope = dy / np.maximum(1e-6, np.diff(xs))
+        cuts = np.flatnonzero((dy > max_dy) | (slope > max_slope)) + 1
 
-        def smooth_segment(seg: List[Point]) -> List[Point]:
-            if len(seg) < config.TERRAIN_SMOOTH_MIN_POINTS:
-                return seg
-            out: List[Point] = []
-            ext = [seg[0]] + seg + [seg[-1]]
-            for j in range(1, len(ext) - 2):
-                p0 = ext[j - 1]
-                p1 = ext[j]
-                p2 = ext[j + 1]
-                p3 = ext[j + 2]
-                for s in range(subdivs):
-                    t = s / subdivs
-                    t2 = t * t
-                    t3 = t2 * t
-                    x = 0.5 * ((2 * p1[0]) + (-p0[0] + p2[0]) * t + (2*p0[0] - 5*p1[0] + 4*p2[0] - p3[0]) * t2 + (-p0[0] + 3*p1[0] - 3*p2[0] + p3[0]) * t3)
-                    y = 0.5 * ((2 * p1[1]) + (-p0[1] + p2[1]) * t + (2*p0[1] - 5*p1[1] + 4*p2[1] - p3[1]) * t2 + (-p0[1] + 3*p1[1] - 3*p2[1] + p3[1]) * t3)
-                    out.append((x, y))
-            out.append(seg[-1])
-            return out
+        def smooth_segment(v: np.ndarray) -> np.ndarray:
+            # All spans at once: row j of ``ctrl`` is (p0, p1, p2, p3) for span p1 -> p2,
+            # with the end points duplicated as phantom neighbours
+            ext = np.concatenate((v[:1], v, v[-1:]))
+            ctrl = np.stack((ext[:-3], ext[1:-2], ext[2:-1], ext[3:]), axis=1)
+            return np.append((ctrl @ weights.T).ravel(), v[-1])
 
-        smoothed: List[Point] = []
-        for seg in segments:
-            smoothed.extend(smooth_segment(seg))
-        if not smoothed:
-            return pts
+        seg_x: List[np.ndarray] = []
+        seg_y: List[np.ndarray] = []
+        for sx, sy in zip(np.split(xs, cuts), np.split(ys, cuts)):
+            if len(sx) < 2:
+                continue  # lone points between cuts are dropped
+            if len(sx) < config.TERRAIN_SMOOTH_MIN_POINTS:
+                seg_x.append(sx)
+                seg_y.append(sy)
+            else:
+                seg_x.append(smooth_segment(sx))
+                seg_y.append(smooth_segment(sy))
+        if not seg_x:
+            return xs, ys
+        out_x = np.concatenate(seg_x)
+        out_y = np.concatenate(seg_y)
         if config.TERRAIN_SMOOTH_VERTICAL_CLAMP:
-            raw_min = min(p[1] for p in pts)
-            raw_max = max(p[1] for p in pts)
-            band_min = raw_min - config.TERRAIN_SMOOTH_VERTICAL_CLAMP
-            band_max = raw_max + config.TERRAIN_SMOOTH_VERTICAL_CLAMP
-            smoothed = [(x, max(band_min, min(band_max, y))) for x, y in smoothed]
+            band_min = ys.min() - config.TERRAIN_SMOOTH_VERTICAL_CLAMP
+            band_max = ys.max() + config.TERRAIN_SMOOTH_VERTICAL_CLAMP
+            out_y = np.clip(out_y, band_min, band_max)
         # Optional spike filter pass to relax sharp isolated upward spikes
-        if getattr(config, 'SPIKE_FILTER_ENABLED', False):
-            threshold = getattr(config, 'SPIKE_FILTER_THRESHOLD', 18.0)
-            relax = getattr(config, 'SPIKE_RELAX_FACTOR', 0.5)
-            passes = getattr(config, 'SPIKE_FILTER_PASSES', 1)
+        if spike:
             for _ in range(passes):
-                changed = False
-                new_pts: List[Point] = list(smoothed)
-                for i in range(2, len(smoothed) - 2):
-                    x, y = smoothed[i]
-                    # average of two neighbors on each side for stability
-                    y_prev = (smoothed[i - 1][1] + smoothed[i - 2][1]) * 0.5
-                    y_next = (smoothed[i + 1][1] + smoothed[i + 2][1]) * 0.5
-                    avg = 0.5 * (y_prev + y_next)
-                    diff = y - avg
-                    if diff < -threshold:  # negative diff => point significantly above surrounding (smaller y is higher visually)
-                        new_y = y - diff * relax  # move toward average
-                        new_pts[i] = (x, new_y)
-                        changed = True
-                smoothed = new_pts
-                if not changed:
+                y = out_y[2:-2]
+                # average of two neighbors on each side for stability
+                y_prev = (out_y[1:-3] + out_y[:-4]) * 0.5
+                y_next = (out_y[3:-1] + out_y[4:]) * 0.5
+                diff = y - 0.5 * (y_prev + y_next)
+                spikes = diff < -threshold  # negative diff => point significantly above surrounding (smaller y is higher visually)
+                if not spikes.any():
                     break
-        return smoothed
+                out_y = out_y.copy()
+                out_y[2:-2] = np.where(spikes, y - diff * relax, y)  # move toward average
+        return out_x, out_y
 
-    def draw(self, surface: pygame.Surface, camera_x: float, day_t: float = 1.0):
+    def draw(self, surface: pygame.Surface, camera_x: float, day_t: float = 1.0, y_offset: int = 0):
         screen_w = surface.get_width()
         screen_h = surface.get_height()
         self.ensure_chunks(camera_x, screen_w)
         left_bound = camera_x - 50
         right_bound = camera_x + screen_w + 50
-        draw_points: List[Point] = []
-        # Gather points from any chunk overlapping
-        for pts in self.chunks.values():
-            for x, y in pts:
-                if x < 0 and not config.ALLOW_NEGATIVE_CHUNKS:
-                    continue
-                if left_bound <= x <= right_bound:
-                    draw_points.append((x, y))
-        if not draw_points:
+        if not config.ALLOW_NEGATIVE_CHUNKS:
+            left_bound = max(left_bound, 0.0)
+        xs, ys = self._visible_ridge(left_bound, right_bound)
+        if not len(xs):
             return
-        # Sort by x to ensure polygon continuity
-        draw_points.sort(key=lambda p: p[0])
-        ridge = draw_points
-        if config.TERRAIN_SMOOTHING_ENABLED:
-            ridge = self._catmull_rom(ridge, config.TERRAIN_SMOOTH_SUBDIVS)
-        # Convert to screen space (camera_x centers player; here simple offset)
-        poly = [(x - camera_x, y) for x, y in ridge]
+        # Convert to screen space (camera_x centers player; here simple offset) in the reused buffer
+        n = len(xs)
+        if self._poly_buf.shape[0] < n + 2:
+            self._poly_buf = np.empty((2 * (n + 2), 2))
+        poly_arr = self._poly_buf[:n + 2]
+        np.subtract(xs, camera_x, out=poly_arr[:n, 0])
+        np.add(ys, y_offset, out=poly_arr[:n, 1])
         # Close polygon down to bottom
-        poly.append((poly[-1][0], screen_h))
-        poly.append((poly[0][0], screen_h))
+        poly_arr[n] = (poly_arr[n - 1, 0], screen_h)
+        poly_arr[n + 1] = (poly_arr[0, 0], screen_h)
+        # pygame takes Python sequences
+        poly = poly_arr.tolist()
         # Biome modulation by large-scale band index
         def lerp(a, b, t):
             return int(a + (b - a) * t)
-        biome_colors = getattr(config, 'BIOME_COLOR_VARIANTS', [config.COLOR_TERRAIN])
-        band_w = getattr(config, 'BIOME_BAND_WIDTH', config.CHUNK_WIDTH * 8)
-        # Determine dominant biome color in visible window via average of band indices
+        biome_colors = self._biome_colors
+        # Dominant biome color in the visible window: the band of the centre chunk
         if biome_colors:
-            avg_x = sum(p[0] for p in ridge) / len(ridge)
-            band_idx = int(avg_x // band_w) % len(biome_colors)
+            center_idx = int(math.floor((camera_x + screen_w / 2) / config.CHUNK_WIDTH))
+            band_idx = self.chunk_biome.get(center_idx)
+            if band_idx is None:
+                band_idx = self._biome_index(center_idx)
             base_col = biome_colors[band_idx]
         else:
             base_col = config.COLOR_TERRAIN
         # Day-night blended terrain base
-        day_col = getattr(config, 'TERRAIN_DAY_COLOR', base_col)
-        night_col = getattr(config, 'TERRAIN_NIGHT_COLOR', base_col)
+        day_col = self._day_col or base_col
+        night_col = self._night_col or base_col
         terrain_col = (lerp(night_col[0], day_col[0], day_t),
                        lerp(night_col[1], day_col[1], day_t),
                        lerp(night_col[2], day_col[2], day_t))
@@ -260,66 +457,74 @@ class TerrainManager:
                         lerp(terrain_col[2], base_col[2], mix))
         pygame.draw.polygon(surface, terrain_col, poly)
         # Ridge highlight
-        highlight = getattr(config, 'RIDGE_HIGHLIGHT_COLOR', (255, 255, 255))
-        hl_alpha = getattr(config, 'RIDGE_HIGHLIGHT_ALPHA', 120)
-        shadow_alpha = getattr(config, 'RIDGE_SHADOW_ALPHA', 60)
-        # Build a temporary surface for highlight/edge with per-pixel alpha
-        edge_surf = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-        sun_dir_x = 0.0
-        sun_dir_y = -1.0
-        # Optional highlight noise
-        noise_mod = None
-        if getattr(config, 'HIGHLIGHT_NOISE_ENABLED', False):
-            noise_mod = Noise1D(seed=self.seed + 777)
-            h_noise_scale = getattr(config, 'HIGHLIGHT_NOISE_SCALE', 0.0015)
-            h_noise_amp = getattr(config, 'HIGHLIGHT_NOISE_AMPLITUDE', 0.35)
-        if getattr(config, 'SLOPE_LIGHTING_ENABLED', False):
-            # Slight forward bias so slopes facing up-left get a bit more light
-            sun_dir_x = -0.3
-            length = math.hypot(sun_dir_x, sun_dir_y)
-            sun_dir_x /= length
-            sun_dir_y /= length
-        for i in range(len(ridge) - 1):
-            (x0, y0), (x1, y1) = ridge[i], ridge[i + 1]
-            seg_dx = x1 - x0
-            seg_dy = y1 - y0
-            if seg_dx == 0:
-                normal = (0.0, -1.0)
-            else:
-                # 2D normal ( -dy, dx ) then normalize; we want upward component
-                nx = -seg_dy
-                ny = seg_dx
-                nl = math.hypot(nx, ny)
-                if nl != 0:
-                    nx /= nl
-                    ny /= nl
-                # Ensure upward facing
-                if ny > 0:
-                    nx = -nx
-                    ny = -ny
-                normal = (nx, ny)
-            if getattr(config, 'SLOPE_LIGHTING_ENABLED', False):
-                dot = normal[0] * sun_dir_x + normal[1] * sun_dir_y
-                dot = max(0.0, dot + getattr(config, 'SUN_NORMAL_BIAS', 0.3))
-                intensity = min(1.0, dot * getattr(config, 'SUN_HIGHLIGHT_STRENGTH', 1.0))
-            else:
-                intensity = 1.0
-            alpha = int(hl_alpha * intensity)
-            if noise_mod is not None:
-                # Sample highlight noise at midpoint x
-                mx = (x0 + x1) * 0.5
-                nval = noise_mod.fractal(mx * h_noise_scale, octaves=2)
-                alpha = int(alpha * (1.0 + h_noise_amp * nval))
-                alpha = max(0, min(255, alpha))
-            pygame.draw.line(edge_surf, (*highlight, alpha), (x0 - camera_x, y0 - 1), (x1 - camera_x, y1 - 1), 2)
-        # Subtle shadow just below ridge
-        for i in range(len(ridge) - 1):
-            (x0, y0), (x1, y1) = ridge[i], ridge[i + 1]
-            if getattr(config, 'RIDGE_SHADOW_SLOPE_ATTEN', 0.0) > 0:
-                slope = abs(y1 - y0) / max(1e-6, (x1 - x0)) if x1 != x0 else 0.0
-                atten = 1.0 - min(1.0, slope * 0.25) * getattr(config, 'RIDGE_SHADOW_SLOPE_ATTEN', 0.6)
-                sa = int(shadow_alpha * atten)
-            else:
-                sa = shadow_alpha
-            pygame.draw.line(edge_surf, (0, 0, 0, sa), (x0 - camera_x, y0 + 2), (x1 - camera_x, y1 + 2), 2)
-        surface.blit(edge_surf, (0, 0))
+        hl_alpha = self._hl_alpha
+        # Highlight/edge layer with per-pixel alpha; only last frame's lines need clearing
+        edge_surf = self._edge_surf
+        if edge_surf is None or edge_surf.get_size() != surface.get_size():
+            edge_surf = self._edge_surf = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+        elif self._edge_dirty is not None:
+            edge_surf.fill((0, 0, 0, 0), self._edge_dirty)
+        # Per-segment lighting terms, computed for the whole ridge at once
+        seg_dx = np.diff(xs)
+        seg_dy = np.diff(ys)
+        if self._slope_lighting:
+            sun_dir_x, sun_dir_y = self._sun_dir
+            # 2D normal ( -dy, dx ) normalized and flipped to face upward; (0, -1) for vertical segments
+            nl = np.hypot(seg_dy, seg_dx)
+            nl = np.where(nl != 0, nl, 1.0)
+            nx = -seg_dy / nl
+            ny = seg_dx / nl
+            down = ny > 0
+            nx = np.where(down, -nx, nx)
+            ny = np.where(down, -ny, ny)
+            vertical = seg_dx == 0
+            nx = np.where(vertical, 0.0, nx)
+            ny = np.where(vertical, -1.0, ny)
+            dot = np.maximum(0.0, (nx * sun_dir_x + ny * sun_dir_y) + self._sun_bias)
+            intensity = np.minimum(1.0, dot * self._sun_strength)
+            hl_alphas = (hl_alpha * intensity).astype(np.int64)
+        else:
+            hl_alphas = np.full(len(seg_dx), int(hl_alpha), dtype=np.int64)
+        if self._hl_noise_enabled:
+            # Highlight noise sampled at every segment midpoint in one batched call
+            mids = (xs[:-1] + xs[1:]) * 0.5
+            nvals = self._highlight_noise.fractal_array(mids * self._hl_noise_scale, octaves=2)
+            hl_alphas = np.clip((hl_alphas * (1.0 + self._hl_noise_amp * nvals)).astype(np.int64), 0, 255)
+        # Row 0: highlight one pixel above the ridge; row 1: subtle shadow just below it
+        alphas = np.empty((2, len(seg_dx)), dtype=np.int64)
+        alphas[0] = hl_alphas
+        if self._shadow_atten > 0:
+            slope = np.where(seg_dx != 0, np.abs(seg_dy) / np.maximum(1e-6, seg_dx), 0.0)
+            alphas[1] = self._shadow_lut[np.minimum(slope * 64, 256).astype(np.int64)]
+        else:
+            alphas[1] = self._shadow_alpha
+        pts = np.empty((2, n, 2))
+        pts[:, :, 0] = poly_arr[:n, 0]
+        pts[0, :, 1] = ys - 1
+        pts[1, :, 1] = ys + 2
+        self._edge_dirty = dirty = self._draw_edge_runs(edge_surf, (self._highlight_col, (0, 0, 0)), alphas, pts)
+        surface.blit(edge_surf, (dirty.x, dirty.y + y_offset), dirty)
+
+    def _draw_edge_runs(self, edge_surf: pygame.Surface, colors, alphas: np.ndarray, pts: np.ndarray) -> pygame.Rect:
+        """Draw each ridge line k in ``colors``: segment i of ``pts[k]`` gets alpha ``alphas[k, i]``.
+
+        Both lines share one pass: alphas are rounded to TERRAIN_EDGE_ALPHA_STEP and run
+        breaks found for the whole (lines, segments) array at once, so runs of consecutive
+        segments sharing a colour go out as one ``draw.lines`` polyline. Lines are drawn
+        in order. Returns the touched area.
+        """
+        step = self._edge_alpha_step
+        if step > 1:
+            alphas = np.minimum(255, (alphas + step // 2) // step * step)
+        n = alphas.shape[1]
+        breaks = np.diff(alphas, axis=1) != 0
+        dirty = None
+        for rgb, row, brk, line in zip(colors, alphas.tolist(), breaks, pts):
+            starts = [0] + (np.flatnonzero(brk) + 1).tolist()
+            ends = starts[1:] + [n]
+            for start, end in zip(starts, ends):
+                if start == end:
+                    continue
+                rect = pygame.draw.lines(edge_surf, (*rgb, row[start]), False, line[start:end + 1].tolist(), 2)
+                dirty = rect if dirty is None else dirty.union(rect)
+        return dirty if dirty is not None else pygame.Rect(0, 0, 0, 0)
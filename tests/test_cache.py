@@ -0,0 +1,19 @@
+from game.cache import LRUCache
+
+
+def test_lru_cache_evicts_least_recently_used():
+    c = LRUCache(maxsize=2)
+    c.store('a', 1)
+    c.store('b', 2)
+    assert c.lookup('a') == 1  # 'a' becomes most recent
+    c.store('c', 3)
+    assert list(c.keys()) == ['a', 'c'], "Oldest untouched entry should be evicted"
+
+
+def test_lru_cache_get_or_build_only_builds_on_miss():
+    c = LRUCache(maxsize=4)
+    calls = []
+    build = lambda: calls.append(1) or 'surf'
+    assert c.get_or_build('k', build) == 'surf'
+    assert c.get_or_build('k', build) == 'surf'
+    assert len(calls) == 1
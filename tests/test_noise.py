@@ -21,4 +21,34 @@ def test_fractal_range_and_mean():
     # Fractal should still be in roughly [-1,1]
     assert all(-1.05 <= v <= 1.05 for v in vals), "Fractal noise out of range"
     mean = sum(vals) / len(vals)
-    assert abs(mean) < 0.1, f"Mean should be near zero, got {mean}"
\ No newline at end of file
+    assert abs(mean) < 0.1, f"Mean should be near zero, got {mean}"
+
+def test_fractal_array_matches_scalar():
+    n = Noise1D(seed=7)
+    xs = [i * 0.173 - 20.0 for i in range(240)]  # include negative inputs
+    batched = n.fractal_array(xs, octaves=4)
+    scalar = [n.fractal(x, octaves=4) for x in xs]
+    assert all(math.isclose(a, b, abs_tol=1e-12) for a, b in zip(batched, scalar)), "Batched fractal should match scalar path"
+
+
+def test_module_level_array_helper_matches_scalar():
+    from game.noise import fractal_noise1, fractal_noise1_array
+    xs = [i * 0.173 - 5.0 for i in range(64)]
+    vals = fractal_noise1_array(xs, octaves=3)
+    for x, v in zip(xs, vals):
+        assert math.isclose(v, fractal_noise1(x, octaves=3), abs_tol=1e-12)
+
+
+def test_fractal_cfunc_matches_scalar():
+    import ctypes
+    import pytest
+    from game.noise import fractal_cfunc
+    fn = fractal_cfunc()
+    if fn is None:
+        pytest.skip("Numba not installed")
+    n = Noise1D(seed=11)
+    grad = n.grad_table
+    ptr = grad.ctypes.data_as(ctypes.POINTER(ctypes.c_double))
+    for i in range(40):
+        x = i * 0.37 - 3.0
+        assert math.isclose(fn.ctypes(x, 4, 2.0, 0.5, ptr, grad.size), n.fractal(x, octaves=4), abs_tol=1e-12)
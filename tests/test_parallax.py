@@ -32,4 +32,28 @@ def test_parallax_relative_motion():
         sf0, d0 = items[i]
         sf1, d1 = items[i + 1]
         # Allow small tolerance due to bucket shifts
-        assert d1 <= d0 + 10.0, f"Parallax ordering unexpected: layer {sf1} delta {d1} vs {sf0} delta {d0}"
\ No newline at end of file
+        assert d1 <= d0 + 10.0, f"Parallax ordering unexpected: layer {sf1} delta {d1} vs {sf0} delta {d0}"
+
+def test_cached_outline_tracks_camera_within_bucket(monkeypatch):
+    import pygame
+    from game import config
+    stride = max(1, getattr(config, 'PARALLAX_CACHE_STRIDE', 1))
+    cam = stride * 10 + stride / 2
+    drawn = []
+    real_polygon = pygame.draw.polygon
+    def capture(surface, color, points, *args):
+        drawn.append([tuple(p) for p in points])
+        return real_polygon(surface, color, points, *args)
+    monkeypatch.setattr(pygame.draw, "polygon", capture)
+    surf = pygame.Surface((800, 600))
+    warm = ParallaxBackground(seed=5)
+    warm.draw(surf, cam - stride / 2)  # fills the outline cache for this bucket
+    drawn.clear()
+    warm.draw(surf, cam)
+    cached = drawn[:len(warm.layers)]
+    drawn.clear()
+    ParallaxBackground(seed=5).draw(surf, cam)
+    fresh = drawn[:len(warm.layers)]
+    for got, want in zip(cached, fresh):
+        assert len(got) == len(want)
+        assert all(abs(gx - wx) < 1e-6 and gy == wy for (gx, gy), (wx, wy) in zip(got, want))
@@ -1,5 +1,5 @@
 import math
-from game.player import Player
+from game.player import Player, _PY
 from game.terrain import TerrainManager
 from game import config
 
@@ -37,3 +37,43 @@ def test_player_jump(monkeypatch):
     player.update(1/60)
     # After one frame of upward velocity, player should have moved upward (smaller y because y increasing means falling)
     assert player.y < start_y, "Player should move upward after jump impulse"
+
+def test_dust_particles_expire():
+    terrain = TerrainManager(seed=3)
+    player = Player(terrain)
+    player._spawn_dust_burst()
+    n = player._n_particles
+    assert n == getattr(config, 'DUST_PARTICLE_COUNT', 8)
+    start_y = player._particles[_PY, :n].copy()
+    player._update_particles(1/60)
+    assert (player._particles[_PY, :n] < start_y).all(), "Dust should drift upward initially"
+    life = getattr(config, 'DUST_PARTICLE_LIFETIME', 0.5)
+    for _ in range(int(life * 60) + 2):
+        player._update_particles(1/60)
+    assert player._n_particles == 0, "Expired particles should be culled"
+
+def test_draw_returns_dirty_rect():
+    import pygame
+    terrain = TerrainManager(seed=4)
+    player = Player(terrain)
+    player.y = 300
+    surf = pygame.Surface((800, 600), pygame.SRCALPHA)
+    first = player.draw(surf, camera_x=-400)
+    player.x += 50
+    second = player.draw(surf, camera_x=-400)
+    assert second.contains(first), "Dirty rect should cover last frame's bounds"
+    assert second.width >= first.width + 50
+
+def test_dust_cull_keeps_survivor_order():
+    from game.player import _PLIFE, _PSIZE
+    terrain = TerrainManager(seed=5)
+    player = Player(terrain)
+    player._spawn_dust_burst()
+    n = player._n_particles
+    # Tag particles by size and expire every other one on the next step
+    player._particles[_PSIZE, :n] = range(1, n + 1)
+    player._particles[_PLIFE, :n:2] = 0.0
+    player._update_particles(1/60)
+    sizes = player._particles[_PSIZE, :player._n_particles]
+    assert player._n_particles == n // 2
+    assert (sizes[1:] > sizes[:-1]).all(), "Survivors should keep their draw order"
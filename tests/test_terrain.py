@@ -7,15 +7,16 @@ def test_chunk_generation_and_boundary_continuity():
     # Force generate two adjacent chunks (0 and 1)
     tm.generate_chunk(0)
     tm.generate_chunk(1)
-    # Last point of chunk 0
-    last_point_chunk0 = tm.chunks[0][-1]
+    # Last point of chunk 0 (chunks are stored as parallel xs, ys arrays)
+    xs0, ys0 = tm.chunks[0]
+    xs1, ys1 = tm.chunks[1]
     # First point inside chunk1 with same x (should exist due to overlap sampling pattern)
-    same_x = last_point_chunk0[0]
+    same_x = xs0[-1]
     # Find matching x in chunk1
-    match = [p for p in tm.chunks[1] if p[0] == same_x]
+    match = [i for i, x in enumerate(xs1) if x == same_x]
     assert match, "Expected overlapping x sample in chunk 1"
-    y0 = last_point_chunk0[1]
-    y1 = match[0][1]
+    y0 = ys0[-1]
+    y1 = ys1[match[0]]
     # After blending we expect small difference (slope continuity attempt) but allow some tolerance
     assert abs(y0 - y1) < config.NOISE_AMPLITUDE * 0.25, "Boundary discontinuity too large"
 
@@ -24,9 +25,62 @@ def test_sample_height_interpolation():
     tm = TerrainManager(seed=1)
     tm.generate_chunk(0)
     # Pick two adjacent sample points
-    p0, p1 = tm.chunks[0][0], tm.chunks[0][1]
-    mid_x = (p0[0] + p1[0]) / 2
+    xs, ys = tm.chunks[0]
+    mid_x = (xs[0] + xs[1]) / 2
     mid_y = tm.sample_height(mid_x)
     # For linear interpolation midpoint should be average of endpoints if function between samples is linear; noise curve may not be linear but our interpolation is
-    expected_mid = (p0[1] + p1[1]) / 2
-    assert abs(mid_y - expected_mid) < config.NOISE_AMPLITUDE * 0.51, "Interpolation midpoint deviates excessively"
\ No newline at end of file
+    expected_mid = (ys[0] + ys[1]) / 2
+    assert abs(mid_y - expected_mid) < config.NOISE_AMPLITUDE * 0.51, "Interpolation midpoint deviates excessively"
+
+def test_pruned_chunk_regenerates_from_cache(monkeypatch):
+    tm = TerrainManager(seed=5)
+    tm.generate_chunk(0)
+    tm.generate_chunk(1)
+    expected = tm.chunks[1][1].copy()
+    del tm.chunks[1]
+    # Revisiting must not resample noise and must reproduce the blended heights
+    def fail(xs):
+        raise AssertionError("cached chunk was resampled")
+    monkeypatch.setattr(tm, "_sample_heights", fail)
+    tm.generate_chunk(1)
+    assert (tm.chunks[1][1] == expected).all()
+
+def test_shared_endpoint_reuses_left_height(monkeypatch):
+    tm = TerrainManager(seed=6)
+    tm.generate_chunk(0)
+    left_xs, left_ys = tm._chunk_cache[0]
+    sampled = []
+    real = tm._sample_heights
+    monkeypatch.setattr(tm, "_sample_heights", lambda xs: sampled.append(xs) or real(xs))
+    tm.generate_chunk(1)
+    # The boundary sample is shared, so only the interior of chunk 1 hits the noise
+    assert sampled[0][0] > left_xs[-1]
+    assert tm._chunk_cache[1][1][0] == left_ys[-1]
+
+def test_async_failure_falls_back_to_sync(monkeypatch):
+    monkeypatch.setattr(config, "ASYNC_TERRAIN_THREAD", True)
+    tm = TerrainManager(seed=7)
+    def boom(idx):
+        raise RuntimeError("worker failed")
+    monkeypatch.setattr(tm, "_sample_chunk_async", boom)
+    screen_w = 960
+    for _ in range(30):
+        tm.ensure_chunks(0.0, screen_w)
+        for fut in list(tm._pending.values()):
+            fut.exception()  # wait for the worker so the next frame collects it
+    assert not tm._pending
+    assert max(tm.chunks) == config.PREFETCH_CHUNKS_AHEAD
+
+
+def test_visible_chunks_stay_synchronous(monkeypatch):
+    monkeypatch.setattr(config, "ASYNC_TERRAIN_THREAD", False)
+    sync = TerrainManager(seed=8)
+    sync.ensure_chunks(0.0, 960)
+    monkeypatch.setattr(config, "ASYNC_TERRAIN_THREAD", True)
+    tm = TerrainManager(seed=8)
+    tm.ensure_chunks(0.0, 960)
+    # On-screen chunks are never deferred to the workers: same installs as the sync path
+    assert sorted(tm.chunks) == sorted(sync.chunks)
+    tm.ensure_chunks(0.0, 960)
+    visible_last = (960 + 50) // config.CHUNK_WIDTH
+    assert all(i in tm.chunks for i in range(0, visible_last + 1))